@@ -0,0 +1,210 @@
+import asyncio
+import functools
+import random
+import time
+import xmlrpc.client
+from typing import Any, Dict, List, Optional, Tuple
+
+from .client import (
+    OdooClient,
+    _BACKOFF_CAP,
+    _READ_METHODS,
+    _REAUTH_FAULT,
+    _RETRYABLE_HTTP,
+    _xml_execute_kw_prefix,
+    _xml_execute_kw_tail,
+    logger,
+)
+from .config import OdooConfig, get_odoo_config
+
+try:  # optional: echtes async HTTP
+    import aiohttp
+except ImportError:  # pragma: no cover - Fallback über Threads
+    aiohttp = None
+
+
+class AsyncOdooClient:
+    """
+    asyncio-Variante des OdooClient für I/O-lastige Fan-outs.
+
+    Mit aiohttp laufen alle execute_kw auf EINEM Thread über einen
+    Keep-Alive-Connection-Pool (limit gleichzeitige Requests), mit derselben
+    Retry-Regel wie OdooClient (Lesen: Verbindungsfehler und 502/503/504;
+    Schreiben: nur gescheiterter Verbindungsaufbau). Ohne aiohttp – oder wenn
+    die Config etwas verlangt, das nur OdooClient kann (protocol="jsonrpc",
+    rps-Limit, Audit-Log) – delegiert der Client an OdooClient in
+    Worker-Threads: gleiche API, gleiche Begrenzung, gleiches Verhalten.
+
+        async with AsyncOdooClient(config) as client:
+            ids = await asyncio.gather(*(client.create(m, v) for v in rows))
+    """
+
+    def __init__(self, config: Optional[OdooConfig] = None, limit: int = 32) -> None:
+        self.config = config or get_odoo_config()
+        self._limit = asyncio.Semaphore(limit)
+        self._connector_limit = limit
+        self._session = None
+        self._uid: Optional[int] = None
+        self._prefix: Optional[bytes] = None
+        self._auth_expires_at = 0.0
+        self._auth_lock = asyncio.Lock()
+        self._object_url = self.config.object_url
+        self._rng = random.Random()
+        native = (
+            aiohttp is not None
+            and self.config.protocol != "jsonrpc"
+            and self.config.rps <= 0
+            and not self.config.audit_enabled
+        )
+        self._sync: Optional[OdooClient] = None if native else OdooClient(self.config)
+
+    async def __aenter__(self) -> "AsyncOdooClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._sync is not None:
+            self._sync.close()
+
+    def _get_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connector_limit, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+                headers={"Content-Type": "text/xml"},
+            )
+        return self._session
+
+    async def _post(self, url: str, body: bytes) -> Any:
+        async with self._get_session().post(url, data=body) as resp:
+            if resp.status != 200:
+                raise xmlrpc.client.ProtocolError(url, resp.status, resp.reason, dict(resp.headers))
+            data = await resp.read()
+        # loads wirft Faults selbst
+        return xmlrpc.client.loads(data, use_builtin_types=True)[0][0]
+
+    async def _post_retry(self, url: str, body: bytes, idempotent: bool) -> Any:
+        """_post mit Full-Jitter-Backoff; nicht-idempotente Calls nur vor dem Senden."""
+        attempt = 0
+        while True:
+            try:
+                return await self._post(url, body)
+            except (aiohttp.ClientConnectionError, xmlrpc.client.ProtocolError) as exc:
+                if not idempotent and not isinstance(exc, aiohttp.ClientConnectorError):
+                    raise
+                if isinstance(exc, xmlrpc.client.ProtocolError) and exc.errcode not in _RETRYABLE_HTTP:
+                    raise
+                attempt += 1
+                if attempt > self.config.max_retries:
+                    raise
+                ceiling = min(_BACKOFF_CAP, self.config.backoff_base * (2 ** (attempt - 1)))
+                delay = self._rng.uniform(0, ceiling)
+                logger.warning(
+                    "RPC-Verbindungsfehler (%s), Versuch %d/%d in %.2fs",
+                    exc, attempt, self.config.max_retries, delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def _credentials_prefix(self) -> bytes:
+        if self._prefix is not None and time.monotonic() < self._auth_expires_at:
+            return self._prefix
+        async with self._auth_lock:
+            if self._prefix is None or time.monotonic() >= self._auth_expires_at:
+                body = xmlrpc.client.dumps(
+                    (self.config.db, self.config.user, self.config.password, {}),
+                    "authenticate",
+                ).encode("utf-8", "xmlcharrefreplace")
+                uid = await self._post_retry(self.config.common_url, body, idempotent=True)
+                if not uid:
+                    raise RuntimeError(
+                        f"Odoo Authentication failed: "
+                        f"DB={self.config.db}, User={self.config.user}, "
+                        f"URL={self.config.url}"
+                    )
+                self._uid = uid
+                self._prefix = _xml_execute_kw_prefix(self.config.db, uid, self.config.password)
+                self._auth_expires_at = time.monotonic() + self.config.auth_ttl
+            return self._prefix
+
+    async def call(self, model: str, method: str, args, **kwargs) -> Any:
+        """Async execute_kw; höchstens `limit` Requests gleichzeitig."""
+        async with self._limit:
+            if self._sync is not None:
+                return await asyncio.to_thread(
+                    functools.partial(self._sync.call, model, method, args, **kwargs)
+                )
+            tail = _xml_execute_kw_tail(model, method, args, kwargs)
+            idempotent = method in _READ_METHODS
+            try:
+                return await self._post_retry(
+                    self._object_url, await self._credentials_prefix() + tail, idempotent
+                )
+            except xmlrpc.client.Fault as exc:
+                if not _REAUTH_FAULT.search(exc.faultString or ""):
+                    raise
+                self._prefix = None  # Session abgelaufen → einmal neu anmelden
+                return await self._post_retry(
+                    self._object_url, await self._credentials_prefix() + tail, idempotent
+                )
+
+    async def gather(self, calls: List[Tuple[str, str, List, Dict[str, Any]]]) -> List[Any]:
+        """Fan-out: [(model, method, args, kwargs), ...] → Ergebnisse in Reihenfolge."""
+        return list(await asyncio.gather(
+            *(self.call(model, method, args, **(kwargs or {})) for model, method, args, kwargs in calls)
+        ))
+
+    # Convenience-Methoden (wie OdooClient)
+    async def search(self, model: str, domain: List, limit: Optional[int] = None) -> List[int]:
+        kwargs: Dict[str, Any] = {}
+        if limit:
+            kwargs["limit"] = limit
+        return await self.call(model, "search", [domain], **kwargs)
+
+    async def search_read(
+        self,
+        model: str,
+        domain: List,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        kwargs: Dict[str, Any] = {}
+        if fields:
+            kwargs["fields"] = fields
+        if limit:
+            kwargs["limit"] = limit
+        return await self.call(model, "search_read", [domain], **kwargs)
+
+    async def read(self, model: str, ids: List[int], fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        kwargs: Dict[str, Any] = {}
+        if fields:
+            kwargs["fields"] = fields
+        return await self.call(model, "read", [ids], **kwargs)
+
+    async def create(self, model: str, vals: Dict[str, Any]) -> int:
+        return await self.call(model, "create", [vals])
+
+    async def write(self, model: str, ids: List[int], vals: Dict[str, Any]) -> bool:
+        return await self.call(model, "write", [ids, vals])
+
+    async def unlink(self, model: str, ids: List[int]) -> bool:
+        return await self.call(model, "unlink", [ids])
+
+    async def ensure_record(
+        self,
+        model: str,
+        domain: List,
+        create_vals: Dict[str, Any],
+        update_vals: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[int, bool]:
+        """Erstelle Record oder update existierenden (idempotent)."""
+        ids = await self.search(model, domain, limit=1)
+        if ids:
+            if update_vals is not None:
+                await self.write(model, ids, update_vals)
+            return ids[0], False
+        return await self.create(model, create_vals), True
@@ -1,51 +1,1033 @@
+import atexit
+import functools
+import gzip
+import http.client
+import itertools
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
 import xmlrpc.client
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import replace
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from .config import OdooConfig, get_odoo_config
+
+try:  # optional: C-beschleunigtes JSON
+    import orjson
+except ImportError:  # pragma: no cover - Fallback ohne orjson
+    orjson = None
+
+try:  # optional: HTTP/2-Multiplexing (httpx + h2)
+    import h2  # noqa: F401 - Backend für httpx.Client(http2=True)
+    import httpx
+except ImportError:  # pragma: no cover - Fallback: HTTP/1.1-Keep-Alive
+    httpx = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+
+    def _audit_dumps(data: Dict[str, Any]) -> str:
+        return orjson.dumps(data).decode()
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
+
+    def _audit_dumps(data: Dict[str, Any]) -> str:
+        return json.dumps(data)
+
+
+# (Sekunde, "YYYY-MM-DDTHH:MM:SS") – strftime nur einmal pro Sekunde
+_ts_cache: Tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp(now: float) -> str:
+    """ISO-8601-UTC mit Mikrosekunden; der Sekundenteil wird gecacht."""
+    global _ts_cache
+    sec = int(now)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)  # Tupel-Zuweisung ist atomar
+    return f"{prefix}.{int((now - sec) * 1_000_000):06d}Z"
+
+
+class _AuditFormatter(logging.Formatter):
+    """
+    Stellt den Zeitstempel aus record.created vor die JSON-Zeile.
+
+    Der LogRecord trägt die Zeit ohnehin – kein zweites time.time() im
+    RPC-Thread, formatiert wird erst im Listener-Thread.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        return f'{{"timestamp":"{_utc_timestamp(record.created)}",{record.getMessage()[1:]}'
+
+
+logger = logging.getLogger(__name__)
+audit_logger = logging.getLogger(f"{__name__}.audit")
+# Pro RPC genutzt → Methoden einmal binden statt global + Attribut-Lookup je Call
+_debug_enabled = logger.isEnabledFor
+_log_debug = logger.debug
+_audit_info = audit_logger.info
+
+# Verbindungs-/Gateway-Fehler, nach denen LESENDE Calls wiederholt werden
+_RETRYABLE_ERRORS = (ConnectionError, xmlrpc.client.ProtocolError)
+_RETRYABLE_HTTP = {502, 503, 504}
+# Verbindungsaufbau gescheitert, Request nie gesendet → auch create/write sicher
+_PRESEND_ERRORS = (ConnectionRefusedError,)
+# Alles, was ein RPC an Server-/Netzfehlern werfen kann (für gezielte except-Blöcke
+# in Flows, statt except Exception auch Programmierfehler zu schlucken)
+RPC_ERRORS = (xmlrpc.client.Fault, xmlrpc.client.ProtocolError, http.client.HTTPException, OSError)
+_BACKOFF_CAP = 60.0
+# Fault-Klassifikation direkt auf faultString (vorkompiliert, ohne str()/lower());
+# re.ASCII: reine ASCII-Muster → einfaches Case-Folding statt Unicode-Tabellen
+_REAUTH_FAULT = re.compile(r"AccessDenied|SessionExpired", re.ASCII)
+_NON_RETRYABLE_FAULT = re.compile(r"ir\.rule|RecordError", re.I | re.ASCII)
+# Antwort eines Servers ohne system.multicall (Standard-Odoo: "Method not available")
+_MULTICALL_UNSUPPORTED = re.compile(r"multicall|not available|not supported", re.I | re.ASCII)
+# Methoden ohne Seiteneffekt; alles andere invalidiert den Read-Cache des Modells
+_READ_METHODS = frozenset({"search", "search_read", "search_count", "read", "read_group", "fields_get"})
+_RO_CACHE_MAX = 1024
+_REF_CACHE_MAX = 4096
+_MISS = object()  # negativer Ref-Cache: XML-ID existiert nicht
+# Große Antworten: bei fast_transport über /jsonrpc (orjson) statt expat-Unmarshaller
+_BULK_READ_METHODS = frozenset({"search_read", "read"})
+
+
+def _simple_terms(domain: List) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """
+    (feld, wert)-Paare, wenn die Domain nur aus UND-verknüpften '='-Termen
+    besteht – solche Probes lassen sich lokal gegen search_read-Zeilen prüfen.
+    """
+    terms = []
+    for term in domain:
+        if not isinstance(term, (list, tuple)) or len(term) != 3 or term[1] != "=":
+            return None
+        value = term[2]
+        if isinstance(value, (list, tuple, dict)):
+            return None
+        terms.append((term[0], value))
+    return tuple(terms) if terms else None
+
+
+def _freeze(value: Any) -> Any:
+    """Domain/Feldlisten rekursiv hashbar machen (Listen → Tupel)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _read_value(value: Any) -> Any:
+    """Wert aus search_read/read vergleichbar machen: many2one [id, name] → id."""
+    if (
+        isinstance(value, (list, tuple))
+        and len(value) == 2
+        and isinstance(value[0], int)
+        and isinstance(value[1], str)
+    ):
+        return value[0]
+    return value
+
+
+_XML_PARAMS_OPEN = "<params>\n"
+_XML_PARAMS_CLOSE = "</params>\n"
+
+
+def _xml_execute_kw_prefix(db: str, uid: int, password: str) -> bytes:
+    """
+    Fester Anfang eines execute_kw-Requests inkl. (db, uid, password).
+
+    Ändert sich nur bei Re-Auth; pro RPC wird nur noch der Rest
+    (model, method, args, kwargs) marshalled.
+    """
+    params = xmlrpc.client.Marshaller("utf-8").dumps((db, uid, password))
+    return (
+        "<?xml version='1.0'?>\n<methodCall>\n<methodName>execute_kw</methodName>\n"
+        + params[:-len(_XML_PARAMS_CLOSE)]
+    ).encode("utf-8", "xmlcharrefreplace")
+
+
+@functools.lru_cache(maxsize=512)
+def _xml_method_head(model: str, method: str) -> bytes:
+    """<param>-Block für (model, method) – konstant je Aufruf-Form, daher gecacht."""
+    params = xmlrpc.client.Marshaller("utf-8").dumps((model, method))
+    return params[len(_XML_PARAMS_OPEN):-len(_XML_PARAMS_CLOSE)].encode("utf-8", "xmlcharrefreplace")
+
+
+class _RawXml(str):
+    """Bereits gerendertes <value>…</value>-Fragment."""
+
+
+class _Marshaller(xmlrpc.client.Marshaller):
+    """Marshaller, der _RawXml-Fragmente unverändert einsetzt."""
+
+    dispatch = dict(xmlrpc.client.Marshaller.dispatch)
+
+    def dump_raw(self, value, write):
+        write(value)
+
+    dispatch[_RawXml] = dump_raw
+
+
+@functools.lru_cache(maxsize=256)
+def _xml_fields_value(fields: Tuple[str, ...]) -> _RawXml:
+    """Feldlisten wiederholen sich tausendfach – ihr XML einmal je Liste rendern."""
+    params = xmlrpc.client.Marshaller("utf-8").dumps((list(fields),))
+    return _RawXml(params[len(_XML_PARAMS_OPEN) + len("<param>\n"):-len("</param>\n" + _XML_PARAMS_CLOSE)])
+
+
+def _xml_execute_kw_tail(model: str, method: str, args, kwargs: Dict[str, Any]) -> bytes:
+    fields = kwargs.get("fields")
+    if fields:
+        kwargs = {**kwargs, "fields": _xml_fields_value(tuple(fields))}
+    # Marshaller pro Aufruf: sein memo ist nicht thread-safe
+    params = _Marshaller("utf-8").dumps((args, kwargs))
+    return _xml_method_head(model, method) + (
+        params[len(_XML_PARAMS_OPEN):] + "</methodCall>\n"
+    ).encode("utf-8", "xmlcharrefreplace")
+
+
+class _BatchingMemoryHandler(MemoryHandler):
+    """
+    MemoryHandler, der den Puffer als EINEN write() an die Datei gibt.
+
+    Der Standard-flush reicht jeden Record einzeln an den FileHandler weiter
+    (write + flush pro Zeile → ein Syscall pro Zeile). Hier werden die
+    formatierten Zeilen zusammengefügt und einmal geschrieben.
+
+    Zusätzlich zu capacity/flushLevel wird spätestens flush_interval Sekunden
+    nach dem ältesten gepufferten Record geschrieben – sonst blieben bei
+    Absturz/SIGKILL oder einem ruhenden Daemon bis zu capacity-1 Audit-Zeilen
+    nur im Speicher.
+    """
+
+    def __init__(self, capacity: int, flushLevel: int, target: logging.Handler, flush_interval: float) -> None:
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self.flush_interval = flush_interval
+        self._timer: Optional[threading.Timer] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        with self.lock:
+            if self.buffer and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self._flush_due)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_due(self) -> None:
+        with self.lock:
+            self._timer = None
+            self.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        super().close()
+
+    def flush(self) -> None:
+        with self.lock:
+            target = self.target
+            if not self.buffer or target is None:
+                return
+            chunk = "".join(target.format(record) + target.terminator for record in self.buffer)
+            last = self.buffer[-1]
+            self.buffer.clear()
+            try:
+                with target.lock:
+                    if target.stream is None:  # FileHandler(delay=True) oder nach close()
+                        target.stream = target._open()
+                    target.stream.write(chunk)
+                    target.flush()
+            except Exception:
+                target.handleError(last)
+
+
+_audit_setup_lock = threading.Lock()
+# (Queue, Puffer) je Audit-Datei – für _flush_audit_log()
+_audit_sinks: List[Tuple[queue.Queue, _BatchingMemoryHandler]] = []
+
+
+@functools.lru_cache(maxsize=None)
+def _setup_audit_logging(path: str) -> None:
+    """
+    Hängt den Audit-Logger über eine Queue an eine Datei.
+
+    Der RPC-Thread macht nur ein queue.put; geschrieben wird im
+    Hintergrund-Thread des QueueListener (Reihenfolge bleibt erhalten).
+    Ein MemoryHandler sammelt bis zu 512 Zeilen und schreibt sie mit einem
+    write() (ERROR sofort, Rest spätestens nach 1 s bzw. beim Beenden).
+    Läuft pro Pfad nur einmal, auch wenn viele Clients parallel entstehen.
+    """
+    with _audit_setup_lock:
+        if any(isinstance(h, QueueHandler) for h in audit_logger.handlers):
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        file_handler = logging.FileHandler(path, encoding="utf-8")
+        file_handler.setFormatter(_AuditFormatter())
+        buffered = _BatchingMemoryHandler(
+            512, flushLevel=logging.ERROR, target=file_handler, flush_interval=1.0
+        )
+        log_queue: queue.Queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, buffered, respect_handler_level=True)
+        audit_logger.addHandler(QueueHandler(log_queue))
+        audit_logger.setLevel(logging.INFO)
+        audit_logger.propagate = False  # JSON-Zeilen nicht zusätzlich über den Root-Logger
+        listener.start()
+        _audit_sinks.append((log_queue, buffered))
+        atexit.register(buffered.close)  # atexit: LIFO → erst Queue leeren, dann Puffer schreiben
+        atexit.register(listener.stop)
+
+
+def _flush_audit_log() -> None:
+    """Wartet, bis der QueueListener alles übernommen hat, und schreibt den Puffer."""
+    for log_queue, buffered in list(_audit_sinks):
+        log_queue.join()  # QueueListener ruft task_done je Record
+        buffered.flush()
+
+
+class _TokenBucket:
+    """
+    Thread-sicherer Token-Bucket (rate Tokens/s, Burst bis cap).
+
+    Wer kein Token mehr bekommt, reserviert trotzdem eins (Bestand wird
+    negativ) und schläft außerhalb des Locks – Wartende blockieren sich
+    so nicht gegenseitig, die Reihenfolge bleibt erhalten.
+    """
+
+    __slots__ = ("rate", "cap", "tokens", "ts", "lock")
+
+    def __init__(self, rate: float, cap: Optional[float] = None) -> None:
+        self.rate = rate
+        self.cap = cap if cap is not None else max(1.0, rate)
+        self.tokens = self.cap
+        self.ts = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self, n: float = 1.0) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.cap, self.tokens + (now - self.ts) * self.rate)
+            self.ts = now
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+class _KeepAliveMixin:
+    """
+    Hält die HTTP(S)-Verbindung über mehrere RPCs offen.
+
+    xmlrpc.client.Transport merkt sich nur EINE (host, conn)-Verbindung;
+    wir halten eine je Host, damit ein geteilter Transport auch bei
+    wechselnden Endpunkten keine Keep-Alive-Verbindung verwirft. common-
+    und object-Proxy teilen sich EINEN Transport (gleicher Host), der
+    TCP/TLS-Handshake fällt so nur einmal an.
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        # use_builtin_types: datetime/bytes statt DateTime/Binary-Wrapper erzeugen
+        super().__init__(use_builtin_types=True)
+        self.timeout = timeout
+        # Explizit, damit auch HTTP/1.0-Proxys vor Odoo die Verbindung offen halten
+        self._headers = self._headers + [("Connection", "keep-alive")]
+        self._conns: Dict[Any, http.client.HTTPConnection] = {}
+
+    def make_connection(self, host):
+        conn = self._conns.get(host)
+        if conn is None:
+            conn = self._conns[host] = super().make_connection(host)
+            conn.timeout = self.timeout
+        else:
+            self._connection = host, conn
+        return conn
+
+    def close(self):
+        conns, self._conns = self._conns, {}
+        self._connection = (None, None)
+        for conn in conns.values():
+            conn.close()
+
+    def parse_response(self, response):
+        """
+        Body einmal lesen und in EINEM feed() an expat geben.
+
+        Die Stdlib liest in 1-KB-Blöcken und ruft pro Block feed() auf –
+        bei großen search_read-Antworten tausende Python-Aufrufe.
+        """
+        body = response.read()
+        if response.getheader("Content-Encoding", "") == "gzip":
+            body = gzip.decompress(body)
+        if self.verbose:
+            print("body:", repr(body))
+        parser, unmarshaller = self.getparser()
+        parser.feed(body)
+        parser.close()
+        return unmarshaller.close()
+
+
+class KeepAliveTransport(_KeepAliveMixin, xmlrpc.client.Transport):
+    pass
+
+
+class KeepAliveSafeTransport(_KeepAliveMixin, xmlrpc.client.SafeTransport):
+    pass
+
+
+def _make_transport(url: str, timeout: Optional[float]) -> xmlrpc.client.Transport:
+    if url.startswith("https://"):
+        return KeepAliveSafeTransport(timeout=timeout)
+    return KeepAliveTransport(timeout=timeout)
+
+
+class HttpxTransport(xmlrpc.client.Transport):
+    """
+    XML-RPC über httpx mit HTTP/2: viele parallele Requests als Streams auf
+    EINER TLS-Verbindung. httpx.Client ist thread-safe, daher teilen sich
+    alle Threads eines OdooClient diesen Transport.
+
+    Ohne h2 (z. B. Klartext-HTTP ohne h2c) fällt httpx auf HTTP/1.1 zurück;
+    max_connections begrenzt dann die parallelen Sockets.
+    """
+
+    def __init__(self, url: str, timeout: Optional[float] = None, max_connections: int = 4) -> None:
+        super().__init__(use_builtin_types=True)
+        parts = urlsplit(url)
+        self._base = f"{parts.scheme}://{parts.netloc}"
+        self._timeout = timeout
+        self._max_connections = max_connections
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    def _http(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        http2=True,
+                        timeout=self._timeout,
+                        limits=httpx.Limits(
+                            max_connections=self._max_connections,
+                            max_keepalive_connections=self._max_connections,
+                        ),
+                        headers={"Content-Type": "text/xml"},
+                    )
+        return self._client
+
+    def request(self, host, handler, request_body, verbose=False):
+        try:
+            resp = self._http().post(self._base + handler, content=request_body)
+        except httpx.TimeoutException as exc:
+            raise TimeoutError(str(exc)) from exc  # wie Socket-Timeout: kein Retry
+        except httpx.ConnectError as exc:
+            raise ConnectionRefusedError(str(exc)) from exc  # vor dem Senden → immer wiederholbar
+        except httpx.TransportError as exc:
+            raise ConnectionError(str(exc)) from exc
+        if resp.status_code != 200:
+            raise xmlrpc.client.ProtocolError(
+                self._base + handler, resp.status_code, resp.reason_phrase, dict(resp.headers)
+            )
+        parser, unmarshaller = self.getparser()
+        parser.feed(resp.content)
+        parser.close()
+        return unmarshaller.close()
+
+    def close(self):
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+
+class JsonRpcTransport:
+    """
+    POSTet JSON-RPC-Requests an {url}/jsonrpc über eine Keep-Alive-Verbindung.
+
+    Fehlerantworten werden als xmlrpc.client.Fault geworfen, damit Aufrufer
+    (z. B. Retry-/AccessDenied-Logik) nicht zwischen Protokollen unterscheiden.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, url: str, timeout: Optional[float] = None) -> None:
+        parts = urlsplit(url)
+        self._https = parts.scheme == "https"
+        self._host = parts.netloc
+        self._path = f"{parts.path.rstrip('/')}/jsonrpc"
+        self.timeout = timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            self._conn = cls(self._host, timeout=self.timeout)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def call(self, service: str, method: str, args: List[Any]) -> Any:
+        body = _json_dumps({
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": service, "method": method, "args": args},
+            "id": next(self._ids),
+        })
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        for attempt in (0, 1):
+            try:
+                conn = self._connection()
+                conn.request("POST", self._path, body=body, headers=headers)
+                data = conn.getresponse().read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Server hat die Keep-Alive-Verbindung geschlossen → einmal neu verbinden
+                self.close()
+                if attempt:
+                    raise
+        reply = _json_loads(data)
+        error = reply.get("error")
+        if error:
+            detail = error.get("data") or {}
+            raise xmlrpc.client.Fault(
+                error.get("code", 1),
+                f"{detail.get('name', '')}: {detail.get('message') or error.get('message')}",
+            )
+        return reply.get("result")
+
+
+class JsonRpcProxy:
+    """ServerProxy-kompatibler Wrapper: proxy.execute_kw(...) / proxy.authenticate(...)."""
+
+    def __init__(self, service: str, transport: JsonRpcTransport) -> None:
+        self._service = service
+        self._transport = transport
+
+    def __getattr__(self, method: str):
+        def _call(*args: Any) -> Any:
+            return self._transport.call(self._service, method, list(args))
+        return _call
+
+    def __call__(self, attr: str):
+        # wie ServerProxy: proxy("close")() bzw. proxy("transport")
+        if attr == "close":
+            return self._transport.close
+        if attr == "transport":
+            return self._transport
+        raise AttributeError(f"Attribute {attr!r} not found")
+
+
+class PipelineResult:
+    """Platzhalter für das Ergebnis eines Pipeline-Calls; darf in args anderer Calls stehen."""
+
+    __slots__ = ("_value", "_done")
+
+    def __init__(self) -> None:
+        self._value: Any = None
+        self._done = False
+
+    def _set(self, value: Any) -> None:
+        self._value = value
+        self._done = True
+
+    @property
+    def value(self) -> Any:
+        if not self._done:
+            raise RuntimeError("Pipeline noch nicht ausgeführt")
+        return self._value
+
+
+def _has_pending(value: Any) -> bool:
+    if isinstance(value, PipelineResult):
+        return not value._done
+    if isinstance(value, (list, tuple)):
+        return any(_has_pending(v) for v in value)
+    if isinstance(value, dict):
+        return any(_has_pending(v) for v in value.values())
+    return False
+
+
+def _resolve(value: Any) -> Any:
+    if isinstance(value, PipelineResult):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return type(value)(_resolve(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _resolve(v) for k, v in value.items()}
+    return value
+
+
+class Pipeline:
+    """
+    Sammelt Calls und schickt sie phasenweise als multicall.
+
+    Calls ohne offene Platzhalter laufen gemeinsam in einer Phase; Calls,
+    die Ergebnisse anderer Calls brauchen (z. B. create nach ref), in der
+    nächsten – aus N × RTT werden so meist 2 × RTT.
+
+        with client.pipeline() as p:
+            uom = p.ref("uom.product_uom_unit")
+            tmpl = p.schedule("product.template", "create", [{"name": "X", "uom_id": uom}])
+        tmpl_id = tmpl.value
+    """
+
+    def __init__(self, client: "OdooClient") -> None:
+        self._client = client
+        self._pending: List[Tuple[str, str, List, Dict[str, Any], Any, PipelineResult]] = []
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, exc_type, *exc: Any) -> None:
+        if exc_type is None:
+            self.execute()
+
+    def schedule(
+        self,
+        model: str,
+        method: str,
+        args: List,
+        kwargs: Optional[Dict[str, Any]] = None,
+        transform=None,
+    ) -> PipelineResult:
+        """Merkt einen execute_kw vor; transform bereitet das Roh-Ergebnis auf."""
+        result = PipelineResult()
+        self._pending.append((model, method, args, kwargs or {}, transform, result))
+        return result
+
+    def ref(self, xml_id: str) -> PipelineResult:
+        """XML-ID → ID; aus dem Ref-Cache des Clients sofort aufgelöst."""
+        cached = self._client._ref_cached(xml_id)
+        if cached is not None:
+            result = PipelineResult()
+            result._set(cached)
+            return result
+        module, _, name = xml_id.partition(".")
+
+        def to_res_id(rows: List[Dict[str, Any]]) -> int:
+            return self._client._ref_store(xml_id, rows[0]["res_id"] if rows else _MISS)
+
+        return self.schedule(
+            "ir.model.data",
+            "search_read",
+            [[["module", "=", module], ["name", "=", name]]],
+            {"fields": ["res_id"], "limit": 1},
+            to_res_id,
+        )
+
+    def execute(self) -> None:
+        while self._pending:
+            ready = [c for c in self._pending if not _has_pending((c[2], c[3]))]
+            if not ready:
+                raise RuntimeError("Pipeline: Platzhalter ohne erzeugenden Call")
+            self._pending = [c for c in self._pending if _has_pending((c[2], c[3]))]
+            results = self._client.multicall([
+                (model, method, _resolve(args), _resolve(kwargs))
+                for model, method, args, kwargs, _, _ in ready
+            ])
+            for (_, _, _, _, transform, result), raw in zip(ready, results):
+                result._set(transform(raw) if transform else raw)
+
+
+class EmptyCreateResult(RuntimeError):
+    """create hat keine ID geliefert (leere Ergebnisliste)."""
 
-from .config import OdooConfig
 
 class OdooClient:
+    __slots__ = (
+        "config", "_db", "_pw", "_max_retries", "_backoff_base",
+        "_uid", "_creds", "_creds_xml", "_xml_host", "_xml_handler",
+        "_auth_expires_at", "_auth_refresh_at", "_auth_lock",
+        "_auth_executor", "_auth_future", "_rng", "_audit_enabled",
+        "_urls", "_transport", "_models", "_owner_thread", "_local",
+        "_pool", "_pool_lock", "_bucket", "_ro_cache", "_ro_ttl",
+        "_multicall_ok", "_ref_cache", "_ref_cache_path", "_ref_lock", "_ref_dirty",
+        "_thread_closers", "_thread_closers_lock",
+        "_fast_reads", "_json_models", "_company_id", "_http2",
+    )
+
     def __init__(self, config: Optional[OdooConfig] = None) -> None:
-        self.config = config or OdooConfig.from_env()
+        self.config = config or get_odoo_config()
+        # Heiße Config-Werte einmal auf den Client pinnen (kein config.x pro RPC)
+        self._db = self.config.db
+        self._pw = self.config.password
+        self._max_retries = self.config.max_retries
+        self._backoff_base = self.config.backoff_base
         self._uid: Optional[int] = None
-        self._common = xmlrpc.client.ServerProxy(f"{self.config.url}/xmlrpc/2/common")
-        self._models = xmlrpc.client.ServerProxy(f"{self.config.url}/xmlrpc/2/object")
+        self._creds: Optional[Tuple[str, int, str]] = None
+        self._creds_xml: Optional[bytes] = None  # XML-RPC: vormarshallter execute_kw-Anfang
+        # Endpunkt-URLs kommen vorformatiert aus der Config (auch für Thread-/Refresh-Proxys)
+        self._urls = {"common": self.config.common_url, "object": self.config.object_url}
+        object_url = urlsplit(self.config.object_url)
+        self._xml_host = object_url.netloc
+        self._xml_handler = object_url.path
+        self._auth_expires_at = 0.0
+        self._auth_refresh_at = 0.0
+        self._auth_lock = threading.Lock()
+        self._auth_executor: Optional[ThreadPoolExecutor] = None
+        self._auth_future: Optional[Future] = None
+        self._rng = random.Random()  # eigener Zufallsstrom je Client (Retry-/TTL-Jitter)
+        if self.config.audit_enabled and self.config.audit_log_file:
+            _setup_audit_logging(self.config.audit_log_file)
+        # Einmal entscheiden statt pro RPC: ohne INFO-Handler kein json.dumps
+        self._audit_enabled = self.config.audit_enabled and audit_logger.isEnabledFor(logging.INFO)
+        self._http2 = self.config.http2 and self.config.protocol != "jsonrpc" and httpx is not None
+        if self.config.http2 and httpx is None:
+            logger.warning("ODOO_HTTP2 gesetzt, aber httpx/h2 nicht installiert – nutze HTTP/1.1")
+        self._transport = self._new_transport()
+        # common-Proxy nur bei Bedarf (authenticate), über denselben Transport
+        self._models = self._make_proxy("object", self._transport)
+        self._owner_thread = threading.get_ident()
+        self._local = threading.local()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # Rate Limiting nur auf Wunsch (ODOO_RPS > 0); Standard: unbegrenzt
+        self._bucket = _TokenBucket(self.config.rps) if self.config.rps > 0 else None
+        # (model, ...) → (Zeitpunkt, Ergebnis); readonly_ttl <= 0 = aus
+        self._ro_cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._ro_ttl = self.config.readonly_ttl
+        self._multicall_ok: Optional[bool] = None  # None = noch nicht geprüft
+        # XML-ID → res_id, über Läufe hinweg in base_data_dir/.ref_cache.json
+        self._ref_cache_path = os.path.join(self.base_data_dir, ".ref_cache.json")
+        self._ref_cache: "Optional[OrderedDict[str, Any]]" = None  # lazy: erst beim ersten ref()
+        self._ref_lock = threading.Lock()
+        self._ref_dirty = False  # neue Einträge → einmal in close()/atexit schreiben
+        self._fast_reads = self.config.fast_transport and self.config.protocol != "jsonrpc"
+        self._json_models: Optional[JsonRpcProxy] = None
+        self._company_id: Optional[int] = None
+        # close() der Verbindungen aus Worker-Threads (_thread_models/_thread_json_models)
+        self._thread_closers: List[Any] = []
+        self._thread_closers_lock = threading.Lock()
 
-    @property
-    def uid(self) -> int:
-        if self._uid is None:
-            self._uid = self._common.authenticate(
-                self.config.db,
+    def close(self) -> None:
+        """
+        Gibt ThreadPools und HTTP-Verbindungen frei (kein __del__: Aufräumen
+        zur GC-Zeit ist bei Interpreter-Shutdown unzuverlässig).
+
+        Empfohlen: ``with OdooClient(config) as client: ...``
+        """
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)  # laufende Calls nutzen noch ihre Thread-Verbindungen
+        with self._auth_lock:
+            executor, self._auth_executor = self._auth_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self._flush_ref_cache()
+        if self._audit_enabled:
+            _flush_audit_log()
+        self._transport.close()
+        if self._json_models is not None:
+            self._json_models("close")()
+            self._json_models = None
+        with self._thread_closers_lock:
+            closers, self._thread_closers = self._thread_closers, []
+        for close in closers:
+            close()
+        self.invalidate_session()
+
+    def __enter__(self) -> "OdooClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _new_transport(self):
+        if self._http2:
+            # Ein thread-safe HTTP/2-Transport für alle Threads (Multiplexing)
+            shared = getattr(self, "_transport", None)
+            if shared is not None:
+                return shared
+            return HttpxTransport(
+                self.config.url,
+                self.config.timeout,
+                self.config.pool_maxsize or self.config.rpc_concurrency,
+            )
+        if self.config.protocol == "jsonrpc":
+            return JsonRpcTransport(self.config.url, self.config.timeout)
+        return _make_transport(self.config.url, self.config.timeout)
+
+    def _make_proxy(self, service: str, transport):
+        """Proxy für 'common' oder 'object' – XML-RPC oder JSON-RPC je nach Config."""
+        if self.config.protocol == "jsonrpc":
+            return JsonRpcProxy(service, transport)
+        return xmlrpc.client.ServerProxy(
+            self._urls[service], transport=transport
+        )
+
+    def _authenticate(self) -> int:
+        """
+        Meldet sich an und setzt Ablauf-/Refresh-Zeitpunkt der Session.
+
+        Läuft auf einem eigenen Transport: Re-Auth kommt aus beliebigen
+        Worker-Threads, die Keep-alive-Verbindung des Owner-Threads ist
+        nicht thread-safe. Die TTL bekommt ±10 % Jitter, damit mehrere
+        Clients nicht zur selben Sekunde neu authentifizieren.
+        """
+        transport = self._new_transport()
+        try:
+            uid = self._with_retry(
+                self._make_proxy("common", transport).authenticate,
+                self._db,
                 self.config.user,
-                self.config.password,
+                self._pw,
                 {},
             )
-            if not self._uid:
-                raise RuntimeError(
-                    f"Odoo Authentication failed: "
-                    f"DB={self.config.db}, User={self.config.user}, "
-                    f"URL={self.config.url}"
+        finally:
+            if transport is not self._transport:  # HTTP/2: geteilter Transport bleibt offen
+                transport.close()
+        if not uid:
+            raise RuntimeError(
+                f"Odoo Authentication failed: "
+                f"DB={self.config.db}, User={self.config.user}, "
+                f"URL={self.config.url}"
+            )
+        ttl = self.config.auth_ttl * self._rng.uniform(0.9, 1.1)
+        now = time.monotonic()
+        self._uid = uid
+        self._creds = (self._db, uid, self._pw)
+        if self.config.protocol != "jsonrpc":
+            self._creds_xml = _xml_execute_kw_prefix(self._db, uid, self._pw)
+        self._auth_expires_at = now + ttl
+        self._auth_refresh_at = now + ttl * self.config.auth_refresh_ratio
+        return uid
+
+    def _refresh_in_background(self) -> None:
+        """Startet (höchstens einen) Re-Auth im Hintergrund; alte uid bleibt gültig."""
+        with self._auth_lock:
+            if self._auth_future is not None and not self._auth_future.done():
+                return
+            if self._auth_executor is None:
+                self._auth_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="odoo-auth"
                 )
+            self._auth_future = self._auth_executor.submit(self._authenticate)
+
+    @property
+    def uid(self) -> int:
+        now = time.monotonic()
+        if self._uid is None or now >= self._auth_expires_at:
+            with self._auth_lock:
+                if self._uid is None or time.monotonic() >= self._auth_expires_at:
+                    return self._authenticate()
+            return self._uid
+        if now >= self._auth_refresh_at:
+            self._refresh_in_background()
         return self._uid
 
+    def invalidate_session(self) -> None:
+        """Verwirft die gecachte uid; der nächste Zugriff meldet sich neu an."""
+        self._uid = None
+        self._creds = None
+        self._creds_xml = None
+        self._auth_expires_at = 0.0
+
+    def _credentials(self) -> Tuple[str, int, str]:
+        """(db, uid, password) für execute_kw; nur nach Ablauf über die uid-Logik."""
+        creds = self._creds
+        if creds is None or time.monotonic() >= self._auth_refresh_at:
+            self.uid  # (Re-)Auth bzw. Hintergrund-Refresh anstoßen
+            creds = self._creds
+        return creds
+
+    def _ref_cache_key(self) -> str:
+        # Getrennt je Instanz + DB, damit sich Mandanten nicht überschreiben
+        return f"{self.config.url}|{self._db}"
+
+    def _ref_entries(self) -> "OrderedDict[str, Any]":
+        """Ref-Cache, beim ersten Zugriff von Platte geladen (Aufrufer hält _ref_lock)."""
+        if self._ref_cache is None:
+            self._ref_cache = self._load_ref_cache()
+        return self._ref_cache
+
+    def _load_ref_cache(self) -> "OrderedDict[str, Any]":
+        try:
+            with open(self._ref_cache_path, encoding="utf-8") as fh:
+                entries = json.load(fh).get(self._ref_cache_key(), {})
+            return OrderedDict(list(entries.items())[-_REF_CACHE_MAX:])
+        except (OSError, ValueError, AttributeError):
+            return OrderedDict()
+
+    def _save_ref_cache(self) -> None:
+        """Schreibt den eigenen Abschnitt zurück (andere Mandanten bleiben erhalten)."""
+        try:
+            with open(self._ref_cache_path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            data = {}
+        data[self._ref_cache_key()] = {k: v for k, v in self._ref_cache.items() if v is not _MISS}
+        tmp_path = f"{self._ref_cache_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, indent=2, sort_keys=True)
+            os.replace(tmp_path, self._ref_cache_path)
+        except OSError as exc:
+            logger.warning("Ref-Cache nicht gespeichert (%s): %s", self._ref_cache_path, exc)
+
+    def ref(self, xml_id: str, cache: bool = True) -> int:
+        """
+        XML-ID ('modul.name', z. B. 'uom.product_uom_unit') → Datenbank-ID.
+
+        Gecacht im Prozess (LRU, max. 4096, inkl. "nicht gefunden") und auf
+        Platte: wiederholte Läufe gegen dieselbe DB brauchen für bekannte
+        XML-IDs keinen RPC mehr. cache=False fragt immer den Server.
+        """
+        if cache:
+            res_id = self._ref_cached(xml_id)
+            if res_id is not None:
+                return res_id
+        module, _, name = xml_id.partition(".")
+        rows = self.call(
+            "ir.model.data",
+            "search_read",
+            [[["module", "=", module], ["name", "=", name]]],
+            fields=["res_id"],
+            limit=1,
+        )
+        return self._ref_store(xml_id, rows[0]["res_id"] if rows else _MISS)
+
+    def _ref_cached(self, xml_id: str) -> Optional[int]:
+        """Cache-Treffer oder None; bekannte Fehlschläge werfen ValueError."""
+        with self._ref_lock:
+            entries = self._ref_entries()
+            res_id = entries.get(xml_id)
+            if res_id is not None:
+                entries.move_to_end(xml_id)
+        if res_id is _MISS:
+            raise ValueError(f"XML-ID nicht gefunden: {xml_id}")
+        return res_id
+
+    def _ref_store(self, xml_id: str, res_id: Any) -> int:
+        with self._ref_lock:
+            entries = self._ref_entries()
+            entries[xml_id] = res_id
+            entries.move_to_end(xml_id)
+            while len(entries) > _REF_CACHE_MAX:
+                entries.popitem(last=False)
+            if res_id is not _MISS and not self._ref_dirty:
+                self._ref_dirty = True
+                atexit.register(self._flush_ref_cache)  # falls close() nie kommt
+        if res_id is _MISS:
+            raise ValueError(f"XML-ID nicht gefunden: {xml_id}")
+        return res_id
+
+    def _flush_ref_cache(self) -> None:
+        """Schreibt neue Ref-Einträge einmal auf Platte (close() bzw. atexit)."""
+        with self._ref_lock:
+            if not self._ref_dirty:
+                return
+            self._ref_dirty = False
+            self._save_ref_cache()
+        atexit.unregister(self._flush_ref_cache)
+
+    def ref_cache_clear(self) -> None:
+        """Leert den Ref-Cache im Speicher (z. B. nach Mandantenwechsel/DB-Reset)."""
+        with self._ref_lock:
+            self._ref_cache = OrderedDict()
+
     @property
     def base_data_dir(self) -> str:
         """Kompatibilität für Loader: config.base_data_dir."""
         return self.config.base_data_dir or "./data"
 
+    @property
+    def company_id(self) -> int:
+        """
+        Erste Firma (Fallback 1), einmal pro Client ermittelt.
+
+        Memo im Slot statt functools.cached_property – OdooClient hat kein __dict__.
+        """
+        if self._company_id is None:
+            company_ids = self.search("res.company", [], limit=1)
+            self._company_id = company_ids[0] if company_ids else 1
+        return self._company_id
+
     @property
     def models(self):
         """Expose models proxy für direkte execute_kw calls."""
         return self._models
 
+    def _thread_models(self):
+        """object-Proxy des aktuellen Threads (HTTP-Verbindungen sind nicht thread-safe)."""
+        if threading.get_ident() == self._owner_thread:
+            return self._models
+        proxy = getattr(self._local, "models", None)
+        if proxy is None:
+            transport = self._new_transport()
+            proxy = self._make_proxy("object", transport)
+            self._local.models = proxy
+            if transport is not self._transport:  # HTTP/2: geteilter Transport
+                with self._thread_closers_lock:
+                    self._thread_closers.append(transport.close)
+        return proxy
+
+    def _thread_json_models(self) -> "JsonRpcProxy":
+        """JSON-RPC-object-Proxy des aktuellen Threads (fast_transport für Bulk-Reads)."""
+        if threading.get_ident() == self._owner_thread:
+            if self._json_models is None:
+                self._json_models = JsonRpcProxy(
+                    "object", JsonRpcTransport(self.config.url, self.config.timeout)
+                )
+            return self._json_models
+        proxy = getattr(self._local, "json_models", None)
+        if proxy is None:
+            proxy = JsonRpcProxy("object", JsonRpcTransport(self.config.url, self.config.timeout))
+            self._local.json_models = proxy
+            with self._thread_closers_lock:
+                self._thread_closers.append(proxy("close"))
+        return proxy
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Lazy ThreadPool für parallele RPCs (rpc_concurrency Worker)."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.config.rpc_concurrency,
+                        thread_name_prefix="odoo-rpc",
+                    )
+        return self._pool
+
+    def map_call(self, model: str, method: str, items: List[Any]) -> List[Any]:
+        """
+        Ruft eine Convenience-Methode (create, write, read, ...) je Item
+        parallel im ThreadPool auf; Ergebnisse in Eingabe-Reihenfolge.
+
+        Tupel-Items werden entpackt: map_call(m, "write", [(ids, vals), ...]).
+        """
+        fn = getattr(self, method)
+        futures = [
+            self._get_pool().submit(fn, model, *(item if isinstance(item, tuple) else (item,)))
+            for item in items
+        ]
+        return [f.result() for f in futures]
+
     @property
     def db(self) -> str:
         """Expose DB name."""
-        return self.config.db
+        return self._db
 
     @property
     def password(self) -> str:
         """Expose password."""
-        return self.config.password
+        return self._pw
 
     def call(self, model: str, method: str, args, **kwargs) -> Any:
         """
@@ -54,22 +1036,193 @@ class OdooClient:
         args: Liste der Positionsargumente für Odoo, z. B.
               [domain], [ids, fields], [vals], ...
         """
-        return self._models.execute_kw(
-            self.config.db,
-            self.uid,
-            self.config.password,
-            model,
-            method,
-            args,
-            kwargs,
-        )
+        if self._ro_ttl > 0 and method not in _READ_METHODS:
+            self.invalidate(model)
+        # Lese-Helfer (search/search_read/read) gehen direkt auf _execute_rpc
+        return self._execute_rpc(model, method, args, kwargs)
+
+    def _cached(self, model: str, method: str, parts: Tuple, fn) -> Any:
+        """
+        TTL-Cache für Lesezugriffe (Stammdaten wie UoM, Lager, BoM-Vorlagen).
+
+        Der Key (model, method, *parts) wird nur bei aktivem Cache gebaut –
+        sonst kostet ein Lesezugriff kein _freeze über Domain/IDs.
+        Das Ergebnis wird geteilt zurückgegeben – Aufrufer dürfen es nicht
+        verändern.
+        """
+        if self._ro_ttl <= 0:
+            return fn()
+        key = (model, method) + tuple(_freeze(p) for p in parts)
+        now = time.monotonic()
+        hit = self._ro_cache.get(key)
+        if hit is not None and now - hit[0] < self._ro_ttl:
+            return hit[1]
+        value = fn()
+        if len(self._ro_cache) >= _RO_CACHE_MAX:
+            self._ro_cache.pop(next(iter(self._ro_cache)), None)  # ältester Eintrag
+        self._ro_cache[key] = (now, value)
+        return value
+
+    def invalidate(self, model: Optional[str] = None) -> None:
+        """Verwirft gecachte Lesezugriffe eines Modells (ohne Argument: alle)."""
+        if model is None:
+            self._ro_cache.clear()
+            return
+        for key in [k for k in list(self._ro_cache) if k[0] == model]:
+            self._ro_cache.pop(key, None)
+
+    def _execute_rpc(self, model: str, method: str, args, kwargs: Dict[str, Any]) -> Any:
+        if _debug_enabled(logging.DEBUG):
+            _log_debug("RPC: %s.%s(args=%d, kwargs=%d)", model, method, len(args), len(kwargs))
+        if self._bucket is not None:
+            self._bucket.take()  # Auth läuft nicht hierüber und bleibt ungebremst
+        started = time.monotonic()
+        idempotent = method in _READ_METHODS
+        try:
+            result = self._with_retry(self._send, model, method, args, kwargs, idempotent=idempotent)
+        except xmlrpc.client.Fault as exc:
+            msg = exc.faultString or ""
+            # Record-Rule-/Datenfehler bleiben Fehler, auch wenn "AccessDenied" im Traceback steht
+            if not _REAUTH_FAULT.search(msg) or _NON_RETRYABLE_FAULT.search(msg):
+                raise
+            # Session serverseitig abgelaufen → einmal neu anmelden
+            self.invalidate_session()
+            result = self._with_retry(self._send, model, method, args, kwargs, idempotent=idempotent)
+
+        if self._audit_enabled:
+            self._audit_log(model, method, time.monotonic() - started)
+        return result
+
+    def _send(self, model: str, method: str, args, kwargs: Dict[str, Any]) -> Any:
+        """Ein execute_kw-Request (ohne Retry/Audit); gebundene Methode statt Closure je RPC."""
+        creds = self._credentials()
+        prefix = self._creds_xml
+        if prefix is None:  # JSON-RPC
+            return self._thread_models().execute_kw(*creds, model, method, args, kwargs)
+        if self._fast_reads and method in _BULK_READ_METHODS:
+            return self._thread_json_models().execute_kw(*creds, model, method, args, kwargs)
+        body = prefix + _xml_execute_kw_tail(model, method, args, kwargs)
+        transport = self._thread_models()("transport")
+        return transport.request(self._xml_host, self._xml_handler, body)[0]
+
+    @property
+    def multicall_supported(self) -> bool:
+        """True erst, wenn system.multicall auf diesem Server schon geklappt hat."""
+        return self._multicall_ok is True
+
+    def multicall(self, calls: List[Tuple[str, str, List, Dict[str, Any]]]) -> List[Any]:
+        """
+        Mehrere execute_kw in EINEM Roundtrip über XML-RPC system.multicall.
+
+        calls: [(model, method, args, kwargs), ...] – Ergebnisse in gleicher
+        Reihenfolge; der erste Fault wird geworfen.
+
+        Standard-Odoo bietet system.multicall auf /xmlrpc/2/object nicht an;
+        dann (und bei JSON-RPC) laufen die Calls parallel im ThreadPool.
+        Die Server-Antwort wird einmal geprüft und gemerkt.
+        """
+        if not calls:
+            return []
+        if len(calls) == 1 or self.config.protocol == "jsonrpc" or self._multicall_ok is False:
+            return self._call_parallel(calls)
+
+        if self._ro_ttl > 0:
+            for model, method, _, _ in calls:
+                if method not in _READ_METHODS:
+                    self.invalidate(model)
+        if self._bucket is not None:
+            self._bucket.take()
+
+        def _once() -> List[Any]:
+            creds = self._credentials()
+            return self._thread_models().system.multicall([
+                {"methodName": "execute_kw", "params": [*creds, model, method, args, kwargs or {}]}
+                for model, method, args, kwargs in calls
+            ])
+
+        try:
+            raw = self._with_retry(
+                _once, idempotent=all(method in _READ_METHODS for _, method, _, _ in calls)
+            )
+        except xmlrpc.client.Fault as exc:
+            if self._multicall_ok is None and _MULTICALL_UNSUPPORTED.search(exc.faultString or ""):
+                logger.info("system.multicall nicht verfügbar – Calls laufen parallel")
+                self._multicall_ok = False
+                return self._call_parallel(calls)
+            raise
+        self._multicall_ok = True
+
+        results: List[Any] = []
+        for item in raw:
+            if isinstance(item, dict):  # {"faultCode": ..., "faultString": ...}
+                raise xmlrpc.client.Fault(item["faultCode"], item["faultString"])
+            results.append(item[0])
+        return results
+
+    def pipeline(self) -> Pipeline:
+        """Context-Manager für phasenweise gebündelte Calls (siehe Pipeline)."""
+        return Pipeline(self)
+
+    def _call_parallel(self, calls: List[Tuple[str, str, List, Dict[str, Any]]]) -> List[Any]:
+        """Fallback für multicall: einzelne RPCs, ab zwei Calls im ThreadPool."""
+        if len(calls) == 1:
+            model, method, args, kwargs = calls[0]
+            return [self.call(model, method, args, **(kwargs or {}))]
+        return list(self._get_pool().map(
+            lambda c: self.call(c[0], c[1], c[2], **(c[3] or {})), calls
+        ))
+
+    def _audit_log(self, model: str, method: str, duration: float) -> None:
+        _audit_info(_audit_dumps({  # timestamp setzt _AuditFormatter
+            "db": self._db,
+            "model": model,
+            "method": method,
+            "duration_ms": round(duration * 1000, 1),
+        }))
+
+    def _with_retry(self, fn, *args: Any, idempotent: bool = True) -> Any:
+        """
+        Wiederholt fn bei Verbindungsfehlern (max_retries, Full-Jitter-Backoff).
+
+        Lesende Calls (idempotent) werden nach Verbindungsabbruch und
+        502/503/504 wiederholt. Schreibende Calls (create/write/unlink/action_*)
+        nur, wenn der Verbindungsaufbau scheiterte – nach Abbruch oder 504
+        könnte der Server schon committet haben (doppelte Records/Buchungen).
+        Timeouts werden nie wiederholt.
+        """
+        attempt = 0
+        while True:
+            try:
+                return fn(*args)
+            except _RETRYABLE_ERRORS as exc:
+                if not idempotent and not isinstance(exc, _PRESEND_ERRORS):
+                    raise
+                if isinstance(exc, xmlrpc.client.ProtocolError) and exc.errcode not in _RETRYABLE_HTTP:
+                    raise
+                attempt += 1
+                if attempt > self._max_retries:
+                    raise
+                delay = self._calculate_backoff(attempt)
+                logger.warning(
+                    "RPC-Verbindungsfehler (%s), Versuch %d/%d in %.2fs",
+                    exc, attempt, self._max_retries, delay,
+                )
+                time.sleep(delay)
+
+    def _calculate_backoff(self, attempt: int) -> float:
+        """AWS-"Full Jitter": zufällig in [0, min(cap, base * 2^(attempt-1))]."""
+        ceiling = min(_BACKOFF_CAP, self._backoff_base * (2 ** (attempt - 1)))
+        return self._rng.uniform(0, ceiling)
 
     # Convenience-Methoden
     def search(self, model: str, domain: List, limit: Optional[int] = None) -> List[int]:
         kwargs: Dict[str, Any] = {}
         if limit:
             kwargs["limit"] = limit
-        return self.call(model, "search", [domain], **kwargs)
+        return self._cached(
+            model, "search", (domain, limit),
+            lambda: self._execute_rpc(model, "search", [domain], kwargs),
+        )
 
     def search_read(
         self,
@@ -77,13 +1230,126 @@ class OdooClient:
         domain: List,
         fields: Optional[List[str]] = None,
         limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        kwargs = self._search_read_kwargs(fields, limit, offset, order)
+        return self._cached(
+            model, "search_read", (domain, fields, limit, offset, order),
+            lambda: self._execute_rpc(model, "search_read", [domain], kwargs),
+        )
+
+    def search_count(self, model: str, domain: List) -> int:
+        return self._cached(
+            model, "search_count", (domain,),
+            lambda: self._execute_rpc(model, "search_count", [domain], {}),
+        )
+
+    def read_group(
+        self,
+        model: str,
+        domain: List,
+        fields: List[str],
+        groupby: List[str],
+        orderby: Optional[str] = None,
+        limit: Optional[int] = None,
+        lazy: bool = True,
     ) -> List[Dict[str, Any]]:
+        """
+        GROUP BY in Postgres: eine Zeile je Gruppe statt aller Records.
+
+        fields mit Aggregat, z. B. ["quantity:sum"]; lazy=False gruppiert über
+        alle groupby-Felder auf einmal und liefert __count je Gruppe.
+        """
+        kwargs: Dict[str, Any] = {}
+        if orderby:
+            kwargs["orderby"] = orderby
+        if limit:
+            kwargs["limit"] = limit
+        if not lazy:
+            kwargs["lazy"] = False
+        return self._cached(
+            model, "read_group", (domain, fields, groupby, orderby, limit, lazy),
+            lambda: self._execute_rpc(model, "read_group", [domain, fields, groupby], kwargs),
+        )
+
+    @staticmethod
+    def _search_read_kwargs(
+        fields: Optional[List[str]],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order: Optional[str] = None,
+    ) -> Dict[str, Any]:
         kwargs: Dict[str, Any] = {}
         if fields:
             kwargs["fields"] = fields
         if limit:
             kwargs["limit"] = limit
-        return self.call(model, "search_read", [domain], **kwargs)
+        if offset:
+            kwargs["offset"] = offset
+        if order:
+            kwargs["order"] = order
+        return kwargs
+
+    def _search_read_page(
+        self,
+        model: str,
+        domain: List,
+        fields: Optional[List[str]],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """search_read ohne Lese-Cache: Paging-Seiten würden ihn nur fluten."""
+        kwargs = self._search_read_kwargs(fields, limit, offset, order)
+        return self._execute_rpc(model, "search_read", [domain], kwargs)
+
+    def search_read_all(
+        self,
+        model: str,
+        domain: List,
+        fields: Optional[List[str]] = None,
+        page: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Liest alle Treffer seitenweise; die Seiten laufen parallel im ThreadPool.
+
+        search_count bestimmt die Seitenzahl, order='id' hält das Paging stabil.
+        Seiten gehen am Lese-Cache vorbei.
+        """
+        page = page or self.config.for_call("search_read")
+        total = self.call(model, "search_count", [domain])
+        if total <= page:
+            return self._search_read_page(model, domain, fields, order="id")
+        pages = self._get_pool().map(
+            lambda off: self._search_read_page(model, domain, fields, limit=page, offset=off, order="id"),
+            range(0, total, page),
+        )
+        return list(itertools.chain.from_iterable(pages))
+
+    def iter_search_read(
+        self,
+        model: str,
+        domain: List,
+        fields: Optional[List[str]] = None,
+        batch: Optional[int] = None,
+        order: str = "id",
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Liefert Treffer seitenweise (je batch Zeilen) statt als eine Liste –
+        Spitzenspeicher O(batch) statt O(N), z. B. für Audits über 100k Zeilen.
+
+        order muss eindeutig sein (Default 'id'), sonst verrutscht das Paging.
+        """
+        batch = batch or self.config.for_call("search_read")
+        offset = 0
+        while True:
+            rows = self._search_read_page(model, domain, fields, limit=batch, offset=offset, order=order)
+            if rows:
+                yield rows
+            if len(rows) < batch:
+                return
+            offset += len(rows)
 
     def read(self, model: str, ids: List[int], fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
@@ -96,18 +1362,89 @@ class OdooClient:
             
         Returns:
             List of dicts with requested fields
+
+        Mehr als read_batch_size IDs werden in Chunks parallel gelesen
+        (Reihenfolge bleibt erhalten).
         """
         kwargs: Dict[str, Any] = {}
         if fields:
             kwargs["fields"] = fields
-        return self.call(model, "read", [ids], **kwargs)
+        size = self.config.for_call("read")
+
+        def fetch() -> List[Dict[str, Any]]:
+            if len(ids) <= size:
+                return self._execute_rpc(model, "read", [ids], kwargs)
+            chunks = [ids[i:i + size] for i in range(0, len(ids), size)]
+            parts = self._get_pool().map(
+                lambda chunk: self._execute_rpc(model, "read", [chunk], kwargs), chunks
+            )
+            return list(itertools.chain.from_iterable(parts))
 
-    def create(self, model: str, vals: Dict[str, Any]) -> int:
-        return self.call(model, "create", [vals])
+        return self._cached(model, "read", (ids, fields), fetch)
+
+    def create(self, model: str, vals: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Union[int, List[int]]:
+        """
+        Fester Rückgabe-Vertrag: dict → int, Liste von dicts → List[int]
+        (über create_many). Aufrufer brauchen keine list/tuple-Prüfung.
+        """
+        if isinstance(vals, list):
+            return self.create_many(model, vals)
+        result = self.call(model, "create", [vals])
+        if isinstance(result, list):
+            if not result:
+                raise EmptyCreateResult(f"{model}.create hat keine ID geliefert.")
+            return result[0]
+        return result
+
+    def create_many(self, model: str, vals_list: List[Dict[str, Any]]) -> List[int]:
+        """
+        Legt viele Records über Odoos list-vals-create an (ein RPC je
+        write_batch_size; mehrere Chunks parallel im ThreadPool).
+
+        Returns: IDs in Reihenfolge von vals_list.
+        """
+        if not vals_list:
+            return []
+        size = self.config.for_call("write")
+        chunks = [vals_list[i:i + size] for i in range(0, len(vals_list), size)]
+
+        def create_chunk(chunk: List[Dict[str, Any]]) -> List[int]:
+            return self.call(model, "create", [chunk])
+
+        if len(chunks) == 1:
+            return create_chunk(chunks[0])
+        return list(itertools.chain.from_iterable(self._get_pool().map(create_chunk, chunks)))
 
     def write(self, model: str, ids: List[int], vals: Dict[str, Any]) -> bool:
         return self.call(model, "write", [ids, vals])
 
+    def write_many(self, model: str, id_to_vals: Dict[int, Dict[str, Any]]) -> bool:
+        """Ein write je unterschiedlichem Wertesatz statt einem je Record."""
+        return self.write_grouped(model, list(id_to_vals.items()))
+
+    def write_grouped(self, model: str, updates: List[Tuple[int, Dict[str, Any]]]) -> bool:
+        """
+        Gruppiert (id, vals)-Paare nach identischen vals: ein write mit allen
+        IDs je Gruppe, alle Gruppen zusammen in einem multicall.
+        Typisch: 5000× {'active': True} → ein einziger write.
+        Mehrfache IDs: der letzte Eintrag gewinnt (sonst landet dieselbe ID
+        in zwei parallel laufenden writes mit unbestimmter Reihenfolge).
+        """
+        latest: Dict[int, Dict[str, Any]] = dict(updates)
+        buckets: Dict[Any, Tuple[Dict[str, Any], List[int]]] = {}
+        for rec_id, vals in latest.items():
+            try:
+                key = frozenset((k, _freeze(v)) for k, v in vals.items())
+                hash(key)
+            except TypeError:  # z. B. dict-Werte
+                key = repr(sorted(vals.items()))
+            buckets.setdefault(key, (vals, []))[1].append(rec_id)
+        if len(buckets) == 1:
+            vals, ids = next(iter(buckets.values()))
+            return self.write(model, ids, vals)
+        self.multicall([(model, "write", [ids, vals], {}) for vals, ids in buckets.values()])
+        return True
+
     def unlink(self, model: str, ids: List[int]) -> bool:
         return self.call(model, "unlink", [ids])
 
@@ -119,11 +1456,186 @@ class OdooClient:
         update_vals: Optional[Dict[str, Any]] = None,
     ) -> Tuple[int, bool]:
         """Erstelle Record oder update existierenden (idempotent)."""
-        ids = self.search(model, domain, limit=1)
-        if ids:
-            if update_vals is not None:  # FIX: None-Check
-                self.write(model, ids, update_vals)
-            return ids[0], False
-
-        rec_id = self.create(model, create_vals)
-        return rec_id, True
+        return self.ensure_records_bulk(model, [(domain, create_vals, update_vals)])[0]
+
+    def ensure_records_bulk(
+        self,
+        model: str,
+        items: List[Tuple[List, Dict[str, Any], Optional[Dict[str, Any]]]],
+    ) -> List[Tuple[int, bool]]:
+        """
+        ensure_record für viele (domain, create_vals, update_vals) auf einmal:
+        ein multicall mit allen search-Probes, ein multicall mit allen
+        write/create. Gleiche Domains werden nur einmal angelegt.
+
+        Returns: (id, created) je Item, in Eingabe-Reihenfolge.
+        """
+        first_of: Dict[Any, int] = {}
+        unique: List[int] = []
+        for idx, (domain, _, _) in enumerate(items):
+            key = _freeze(domain)
+            if key not in first_of:
+                first_of[key] = idx
+                unique.append(idx)
+
+        found = self._probe_domains(model, [items[i][0] for i in unique])
+
+        resolved: Dict[int, Tuple[int, bool]] = {}
+        ops: List[Tuple[str, str, List, Dict[str, Any]]] = []
+        created: List[int] = []
+        for idx, ids in zip(unique, found):
+            _, create_vals, update_vals = items[idx]
+            if ids:
+                resolved[idx] = (ids[0], False)
+                if update_vals is not None:  # FIX: None-Check
+                    ops.append((model, "write", [ids, update_vals], {}))
+            else:
+                created.append(idx)
+                ops.append((model, "create", [create_vals], {}))
+
+        results = self.multicall(ops)
+        new_ids = [r for (_, method, _, _), r in zip(ops, results) if method == "create"]
+        for idx, rec_id in zip(created, new_ids):
+            resolved[idx] = (rec_id, True)
+
+        return [resolved[first_of[_freeze(domain)]] for domain, _, _ in items]
+
+    def _probe_domains(self, model: str, domains: List[List]) -> List[List[int]]:
+        """
+        search(limit=1) für viele Domains. Reine '='-Domains werden per
+        '|' zu EINEM search_read (je search_read_batch_size) zusammengefasst und lokal
+        zugeordnet; alles andere läuft als multicall einzelner searches.
+
+        Lokal wird nur exakt verglichen (many2one → id). Liefert der Server
+        Zeilen, die keiner Probe zuzuordnen sind (Typ-Coercion wie 1 vs. '1'),
+        bekommen die offenen Probes dieses Chunks je ein eigenes search –
+        sonst würde ensure_records_bulk Duplikate anlegen.
+        """
+        simple = [_simple_terms(d) for d in domains]
+        if len(domains) == 1 or any(t is None for t in simple):
+            return self.multicall([(model, "search", [d], {"limit": 1}) for d in domains])
+
+        fields = sorted({f for terms in simple for f, _ in terms})
+        signatures = {tuple(f for f, _ in terms) for terms in simple}
+        first_hit: Dict[Tuple, int] = {}
+        unresolved: List[Tuple] = []
+        size = self.config.for_call("search_read")
+        for start in range(0, len(simple), size):
+            chunk = simple[start:start + size]
+            wanted = set(chunk)
+            domain: List[Any] = ["|"] * (len(chunk) - 1)
+            for terms in chunk:
+                domain += ["&"] * (len(terms) - 1) + [[f, "=", v] for f, v in terms]
+            stray = False
+            for row in self.call(model, "search_read", [domain], fields=fields):
+                matched = False
+                for sig in signatures:
+                    key = tuple((f, _read_value(row.get(f))) for f in sig)
+                    if key in wanted:
+                        matched = True
+                        first_hit.setdefault(key, row["id"])  # Reihenfolge = _order wie bei search
+                stray = stray or not matched
+            if stray:
+                unresolved += [terms for terms in dict.fromkeys(chunk) if terms not in first_hit]
+
+        if unresolved:
+            found = self.multicall([
+                (model, "search", [[[f, "=", v] for f, v in terms]], {"limit": 1})
+                for terms in unresolved
+            ])
+            for terms, ids in zip(unresolved, found):
+                if ids:
+                    first_hit[terms] = ids[0]
+
+        return [[first_hit[terms]] if terms in first_hit else [] for terms in simple]
+
+    def ensure_records(
+        self,
+        model: str,
+        records: List[Dict[str, Any]],
+        match_fields: List[str],
+        update: bool = True,
+    ) -> List[Tuple[int, bool]]:
+        """
+        Bulk-Variante von ensure_record: ein search_read für alle Keys,
+        ein create für alle fehlenden Records, ein write je Wertegruppe.
+
+        Doppelte Match-Keys in `records` werden vorab zusammengeführt
+        (letzter Wert gewinnt) und kosten keinen eigenen RPC. Bestehende
+        Records werden gegen die gelesenen Werte gedifft: geschrieben werden
+        nur abweichende Felder, unveränderte Records gar nicht.
+
+        Returns: (id, created) je Eingabe-Record, in Eingabe-Reihenfolge.
+        """
+        if not records:
+            return []
+
+        def key_of(row: Dict[str, Any]) -> Tuple:
+            # many2one kommt aus search_read als [id, name] zurück
+            return tuple(_read_value(row.get(f)) for f in match_fields)
+
+        # None im Match-Key würde in Odoo auf "Feld nicht gesetzt" matchen
+        unique: Dict[Tuple, Dict[str, Any]] = {}
+        positions: List[Tuple] = []
+        for rec in records:
+            key = key_of(rec)
+            if any(v is None for v in key):
+                raise ValueError(
+                    f"ensure_records({model}): Match-Feld {match_fields} fehlt in {rec!r}"
+                )
+            positions.append(key)
+            if key in unique:
+                unique[key].update(rec)
+            else:
+                unique[key] = dict(rec)
+
+        first = match_fields[0]
+        values = list({key[0] for key in unique})
+        fields = list(match_fields)
+        if update:  # zu schreibende Felder mitlesen → Diff in Python
+            fields += sorted({f for rec in unique.values() for f in rec} - set(match_fields))
+        existing: Dict[Tuple, Dict[str, Any]] = {}
+        for row in self.search_read(model, [[first, "in", values]], fields):
+            existing.setdefault(key_of(row), row)
+
+        resolved: Dict[Tuple, Tuple[int, bool]] = {}
+        missing: List[Tuple] = []
+        updates: Dict[int, Dict[str, Any]] = {}
+        for key, rec in unique.items():
+            row = existing.get(key)
+            if row is None:
+                missing.append(key)
+                continue
+            resolved[key] = (row["id"], False)
+            if update:
+                # Odoo liefert leere Felder als False; x2many-Befehle weichen immer ab
+                changed = {
+                    f: v for f, v in rec.items()
+                    if _read_value(row.get(f)) != (False if v is None else v)
+                }
+                if changed:
+                    updates[row["id"]] = changed
+
+        new_ids = self.create_many(model, [unique[key] for key in missing])
+        for key, rec_id in zip(missing, new_ids):
+            resolved[key] = (rec_id, True)
+
+        if updates:
+            self.write_many(model, updates)
+
+        return [resolved[key] for key in positions]
+
+
+class JsonRpcOdooClient(OdooClient):
+    """
+    OdooClient fest auf JSON-RPC (/jsonrpc, orjson falls installiert).
+
+    Gleiche API wie OdooClient – nur der Transport ist fix, unabhängig von
+    ODOO_PROTOCOL. Batches laufen über multicall → ThreadPool, da Odoos
+    /jsonrpc keine JSON-RPC-Batch-Arrays annimmt.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, config: Optional[OdooConfig] = None) -> None:
+        super().__init__(replace(config or get_odoo_config(), protocol="jsonrpc"))
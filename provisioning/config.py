@@ -1,7 +1,10 @@
 # config.py (erweitert – behält aktuelle Struktur)
+import functools
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
 
 
 from dotenv import load_dotenv
@@ -10,7 +13,34 @@ from dotenv import load_dotenv
 # Basisverzeichnis des Projekts
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ENV_PATH = os.path.join(BASE_DIR, ".env")
-load_dotenv(ENV_PATH)
+
+
+ENV_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config_cache.py")
+
+
+def _bootstrap() -> None:
+    """
+    Einmalige Seiteneffekte beim ersten Import (.env laden).
+
+    Gibt es einen aktuellen config_cache.py (scripts/dump_env.py), wird das
+    vorkompilierte Dict übernommen statt .env per Regex zu parsen. Ist .env
+    neuer als der Cache, gilt .env. Gesetzte Umgebungsvariablen gewinnen
+    wie bei load_dotenv.
+    """
+    try:
+        if os.path.getmtime(ENV_CACHE_PATH) >= os.path.getmtime(ENV_PATH):
+            from .config_cache import ENV
+            os.environ.update({k: v for k, v in ENV.items() if k not in os.environ})
+            return
+    except (OSError, ImportError):
+        pass
+    load_dotenv(ENV_PATH)
+
+
+# reload() führt das Modul im selben __dict__ erneut aus → Flag bleibt erhalten
+if not globals().get("_BOOTSTRAPPED"):
+    _bootstrap()
+    _BOOTSTRAPPED = True
 
 
 # Datenpfad für Mengenstückliste (normalisierte CSV)
@@ -44,66 +74,107 @@ UMH_EVENTS_PRODUCTION_FILE = os.path.join(
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAILSERVER KONFIGURATION (hardcoded + ENV-Platzhalter)
 # ═══════════════════════════════════════════════════════════════════════════════
-MAILSERVERS_CONFIG: List[Dict[str, Any]] = [
-    # Gmail SMTP (korrekte Felder für ir.mail_server)
-    {
-        "type": "smtp",
-        "name": "Gmail SMTP",
-        "smtp_host": "smtp.gmail.com",           # ← smtp_host statt smtp!
-        "smtp_port": 587,
-        "smtp_encryption": "starttls",           # ← smtp_encryption
-        "smtp_user": os.getenv("GMAIL_SMTP_USER"),  # ← smtp_user
-        "smtp_pass": os.getenv("GMAIL_SMTP_PASS"),
-        "active": True,
-        "sequence": 10,
-    },
-    # Office365 SMTP
-    {
-        "type": "smtp",
-        "name": "Office365 SMTP",
-        "smtp_host": "smtp.office365.com",
-        "smtp_port": 587,
-        "smtp_encryption": "starttls",
-        "smtp_user": os.getenv("OFFICE365_USER"),
-        "smtp_pass": os.getenv("OFFICE365_PASS"),
-        "active": True,
-        "sequence": 20,
-    },
-    # Office365 IMAP
-    {
-        "type": "imap",
-        "name": "Office365 IMAP", 
-        "server": "outlook.office365.com",
-        "port": 993,
-        "is_ssl": True,
-        "user": os.getenv("OFFICE365_USER"),     # ← user statt login!
-        "password": os.getenv("OFFICE365_PASS"),
-        "active": True,
-        "priority": 10,
-    },
-    # Gmail IMAP
-    {
-        "type": "imap",
-        "name": "Gmail IMAP",
-        "server": "imap.gmail.com",
-        "port": 993,
-        "is_ssl": True,
-        "user": os.getenv("GMAIL_SMTP_USER"),    # ← user
-        "password": os.getenv("GMAIL_SMTP_PASS"),
-        "active": True,
-        "priority": 20,
-    }
-]
+@functools.lru_cache(maxsize=1)
+def mail_servers() -> List[Dict[str, Any]]:
+    """
+    Mailserver-Definitionen, erst beim ersten Aufruf aus der Umgebung gebaut.
+
+    Prozesse ohne Mail-Provisioning zahlen so keine getenv-Aufrufe beim Import.
+    """
+    return [
+        # Gmail SMTP (korrekte Felder für ir.mail_server)
+        {
+            "type": "smtp",
+            "name": "Gmail SMTP",
+            "smtp_host": "smtp.gmail.com",           # ← smtp_host statt smtp!
+            "smtp_port": 587,
+            "smtp_encryption": "starttls",           # ← smtp_encryption
+            "smtp_user": os.getenv("GMAIL_SMTP_USER"),  # ← smtp_user
+            "smtp_pass": os.getenv("GMAIL_SMTP_PASS"),
+            "active": True,
+            "sequence": 10,
+        },
+        # Office365 SMTP
+        {
+            "type": "smtp",
+            "name": "Office365 SMTP",
+            "smtp_host": "smtp.office365.com",
+            "smtp_port": 587,
+            "smtp_encryption": "starttls",
+            "smtp_user": os.getenv("OFFICE365_USER"),
+            "smtp_pass": os.getenv("OFFICE365_PASS"),
+            "active": True,
+            "sequence": 20,
+        },
+        # Office365 IMAP
+        {
+            "type": "imap",
+            "name": "Office365 IMAP", 
+            "server": "outlook.office365.com",
+            "port": 993,
+            "is_ssl": True,
+            "user": os.getenv("OFFICE365_USER"),     # ← user statt login!
+            "password": os.getenv("OFFICE365_PASS"),
+            "active": True,
+            "priority": 10,
+        },
+        # Gmail IMAP
+        {
+            "type": "imap",
+            "name": "Gmail IMAP",
+            "server": "imap.gmail.com",
+            "port": 993,
+            "is_ssl": True,
+            "user": os.getenv("GMAIL_SMTP_USER"),    # ← user
+            "password": os.getenv("GMAIL_SMTP_PASS"),
+            "active": True,
+            "priority": 20,
+        }
+    ]
+
+
 MAILSERVERS_CSV_PATH = os.path.join(BASE_DIR, "mailserver_config.csv")  # Export-Pfad
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)  # unveränderlich → Singleton ohne Lock teilbar, kein __dict__
 class OdooConfig:
     url: str
     db: str
     user: str
     password: str
     base_data_dir: Optional[str] = None  # ← NEU: Für RoutingLoader
+    timeout: float = 120.0  # Socket-Timeout pro RPC (Sekunden)
+    auth_ttl: float = 3600.0  # Gültigkeit der gecachten uid (Sekunden)
+    auth_refresh_ratio: float = 0.9  # Ab diesem Anteil der TTL im Hintergrund erneuern
+    protocol: str = "xmlrpc"  # "xmlrpc" oder "jsonrpc" (/jsonrpc, weniger CPU/Bytes)
+    max_retries: int = 3  # Wiederholungen bei Verbindungsfehlern
+    backoff_base: float = 0.5  # Basis für exponentiellen Backoff (Sekunden)
+    audit_enabled: bool = False  # JSON-Audit-Zeile pro RPC (Logger provisioning.client.audit)
+    audit_log_file: Optional[str] = None  # Zieldatei für das Audit-Log (asynchron geschrieben)
+    batch_size: int = 500  # Records pro Seite/Chunk bei Bulk-Operationen
+    read_batch_size: Optional[int] = None  # read-Chunks (None = batch_size)
+    write_batch_size: Optional[int] = None  # create/write-Chunks (None = batch_size)
+    search_read_batch_size: Optional[int] = None  # search_read-Seiten (None = batch_size)
+    rpc_concurrency: int = 4  # Parallele RPCs (ThreadPool) bei Bulk-Operationen
+    rps: float = 0.0  # Token-Bucket: max. RPCs pro Sekunde (0 = unbegrenzt, Opt-in via ODOO_RPS)
+    readonly_ttl: float = 0.0  # TTL für gecachte search/search_read/read (0 = aus)
+    fast_transport: bool = False  # XML-RPC: search_read/read über /jsonrpc (schnelleres Parsen)
+    http2: bool = False  # XML-RPC über httpx/HTTP2 (optional, braucht httpx + h2)
+    pool_maxsize: Optional[int] = None  # max. Sockets im httpx-Pool (None = rpc_concurrency)
+    # Abgeleitet (__post_init__): Endpunkte einmal formatiert statt je Client/Proxy
+    common_url: str = field(init=False, repr=False)
+    object_url: str = field(init=False, repr=False)
+    scheme: str = field(init=False, repr=False)
+    hostname: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        base = self.url.rstrip("/")
+        parts = urlsplit(base)
+        # frozen → Felder über object.__setattr__ setzen
+        object.__setattr__(self, "common_url", f"{base}/xmlrpc/2/common")
+        object.__setattr__(self, "object_url", f"{base}/xmlrpc/2/object")
+        object.__setattr__(self, "scheme", parts.scheme)
+        object.__setattr__(self, "hostname", parts.hostname or "")
 
 
     @classmethod
@@ -120,4 +191,112 @@ class OdooConfig:
             user=os.getenv("ODOO_USER") or "",
             password=os.getenv("ODOO_PASSWORD") or "",
             base_data_dir=os.getenv("BASE_DATA_DIR", os.path.join(BASE_DIR, "data")),  # Default: ./data
+            timeout=float(os.getenv("ODOO_TIMEOUT", "120")),
+            auth_ttl=float(os.getenv("ODOO_AUTH_TTL", "3600")),
+            auth_refresh_ratio=float(os.getenv("ODOO_AUTH_REFRESH_RATIO", "0.9")),
+            protocol=os.getenv("ODOO_PROTOCOL", "xmlrpc").lower(),
+            max_retries=int(os.getenv("ODOO_MAX_RETRIES", "3")),
+            backoff_base=float(os.getenv("ODOO_BACKOFF_BASE", "0.5")),
+            audit_enabled=_env_flag("ODOO_AUDIT"),
+            audit_log_file=os.getenv("ODOO_AUDIT_LOG") or None,
+            batch_size=int(os.getenv("ODOO_BATCH_SIZE", "500")),
+            read_batch_size=_env_int("ODOO_BATCH_READ"),
+            write_batch_size=_env_int("ODOO_BATCH_WRITE"),
+            search_read_batch_size=_env_int("ODOO_BATCH_SEARCH_READ"),
+            rpc_concurrency=int(os.getenv("ODOO_RPC_CONCURRENCY", "4")),
+            rps=float(os.getenv("ODOO_RPS", "0")),
+            readonly_ttl=float(os.getenv("ODOO_READONLY_TTL", "0")),
+            fast_transport=_env_flag("ODOO_FAST_TRANSPORT"),
+            http2=_env_flag("ODOO_HTTP2"),
+            pool_maxsize=_env_int("ODOO_POOL_MAXSIZE"),
         )
+
+    def for_call(self, kind: str) -> int:
+        """
+        Chunk-Größe je Aufrufart ("read", "write", "search_read").
+
+        Große Lese-Chunks sparen Roundtrips; kleinere Schreib-Chunks halten
+        die Latenz einzelner Transaktionen stabil. Ohne eigenen Wert gilt
+        batch_size.
+        """
+        size = {
+            "read": self.read_batch_size,
+            "write": self.write_batch_size,
+            "search_read": self.search_read_batch_size,
+        }.get(kind)
+        return size or self.batch_size
+
+
+_TRUTHY = frozenset(("1", "true", "yes"))
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").lower() in _TRUTHY
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+_ODOO_CONFIG: Optional[OdooConfig] = None
+_ODOO_CONFIG_LOCK = threading.Lock()
+
+
+def get_odoo_config() -> OdooConfig:
+    """
+    Prozessweit einmal aus der Umgebung gebaute OdooConfig (thread-safe).
+
+    Schneller Pfad ist ein einzelner None-Check; from_env läuft nur beim
+    ersten Aufruf (Double-Checked Locking).
+    """
+    global _ODOO_CONFIG
+    if _ODOO_CONFIG is not None:
+        return _ODOO_CONFIG
+    with _ODOO_CONFIG_LOCK:
+        if _ODOO_CONFIG is None:
+            _ODOO_CONFIG = OdooConfig.from_env()
+    return _ODOO_CONFIG
+
+
+# Unterordner von base_data_dir, ohne die die Loader nichts zu laden haben
+DATA_SUBDIRS = ("data_normalized", "bom", "quality", "production_data")
+
+
+def validate_config(base_data_dir: Optional[str] = None) -> List[str]:
+    """
+    Prüft .env-Pflichtwerte und Datenverzeichnis; liefert die Probleme.
+
+    Läuft nie beim Import, nur explizit (CI: python -m provisioning.config --validate).
+    Die Unterordner werden mit EINEM scandir statt je einem isdir geprüft.
+    """
+    problems: List[str] = []
+    try:
+        config = OdooConfig.from_env()
+    except ValueError as exc:
+        problems.append(str(exc))
+        config = None
+    data_dir = base_data_dir or (config and config.base_data_dir) or os.path.join(BASE_DIR, "data")
+    try:
+        with os.scandir(data_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        problems.append(f"Datenverzeichnis fehlt: {data_dir}")
+    else:
+        problems.extend(
+            f"Unterordner fehlt: {os.path.join(data_dir, name)}" for name in DATA_SUBDIRS if name not in present
+        )
+    return problems
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--validate" not in sys.argv[1:]:
+        sys.exit("Aufruf: python -m provisioning.config --validate")
+    found = validate_config()
+    for problem in found:
+        print(f"❌ {problem}")
+    if not found:
+        print("✅ Config OK")
+    sys.exit(1 if found else 0)
@@ -1,27 +1,31 @@
 from __future__ import annotations
 from typing import Any
 
+# Kein eigener print()-Logger mehr: alles läuft über provisioning.utils
+# (gleiche Ausgabe wie die Loader, respektiert LOG_LEVEL).
+from ..utils import log_error, log_info, log_success, log_warn
 
-def _log(level: str, message: str, *args: Any) -> None:
+
+def _format(message: str, args: tuple) -> str:
     if args:
         try:
-            message = message.format(*args)
+            return message.format(*args)
         except Exception:
             pass
-    print(f"[{level}] {message}")
+    return message
 
 
 def info(message: str, *args: Any) -> None:
-    _log("INFO", message, *args)
+    log_info(_format(message, args))
 
 
 def warning(message: str, *args: Any) -> None:
-    _log("WARN", message, *args)
+    log_warn(_format(message, args))
 
 
 def error(message: str, *args: Any) -> None:
-    _log("ERROR", message, *args)
+    log_error(_format(message, args))
 
 
 def success(message: str, *args: Any) -> None:
-    _log("OK", message, *args)
+    log_success(_format(message, args))
@@ -16,10 +16,16 @@ def safe_float(
     - Bei Fehlern wird `default` zurückgegeben.
     - Wenn `allow_negative` False ist, werden negative Werte auf 0 begrenzt.
     """
-    try:
+    # Schnellpfad: float/int (der Normalfall) ohne float()-Aufruf bzw. try
+    if type(value) is float:
+        f = value
+    elif type(value) is int:
         f = float(value)
-    except (TypeError, ValueError):
-        return default
+    else:
+        try:
+            f = float(value)
+        except (TypeError, ValueError):
+            return default
 
     if not allow_negative and f < 0:
         return 0.0
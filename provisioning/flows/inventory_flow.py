@@ -15,13 +15,22 @@ Nutzt:
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
-from provisioning.client import OdooClient
+from provisioning.client import RPC_ERRORS, OdooClient
 from provisioning.utils import log_info, log_success, log_warn
 
 
+# Sentinel: "noch nicht gesucht" ≠ "gesucht, aber nichts gefunden" (None)
+_MISSING = object()
+
+# Such-Domains der Stammdaten (Einzelsuche und gebündelter Prefetch)
+_SCRAP_LOCATION_DOMAIN = [["usage", "=", "inventory"], ["name", "=", "Scrap"]]
+_INTERNAL_LOCATION_DOMAIN = [["usage", "=", "internal"]]
+_AKKU_DOMAIN = [["name", "=", "Akku"]]
+
+
 def safe_float(value: object, default: float = 0.0, allow_negative: bool = True) -> float:
     """
     Konvertiert einen Wert robust zu float.
@@ -40,45 +49,87 @@ class InventoryFlow:
 
     def __init__(self, api: OdooClient) -> None:
         self.api = api
+        # Lagerorte ändern sich innerhalb eines Laufs nicht → einmal auflösen
+        self._scrap_location_id: Optional[int] = None
+        self._default_internal_location_id: object = _MISSING
+        # Produktname → ID (gefunden oder angelegt); spart Suche bei Wiederholung
+        self._product_ids: Dict[str, int] = {}
+
+    def invalidate_location_cache(self) -> None:
+        """Verwirft gemerkte Lagerort-IDs (für langlebige Flow-Instanzen)."""
+        self._scrap_location_id = None
+        self._default_internal_location_id = _MISSING
 
     # -------------------------------------------------------------------------
     # Hilfsfunktionen
     # -------------------------------------------------------------------------
 
+    def _prefetch_lookups(self) -> None:
+        """
+        Sucht Schrottlager, internen Lagerort und 'Akku' vorab.
+
+        Danach kosten die _get_*-Helfer beim Kaltstart nur noch ein create,
+        falls etwas fehlt. EIN multicall nur, wenn der Server ihn bereits
+        bewiesen hat; sonst drei Suchen nacheinander auf der bestehenden
+        Keep-alive-Verbindung (der Pool-Fallback bräuchte erst einen
+        fehlschlagenden Roundtrip und frische Verbindungen je Thread).
+        """
+        if (
+            self._scrap_location_id is not None
+            and self._default_internal_location_id is not _MISSING
+            and "Akku" in self._product_ids
+        ):
+            return
+        lookups = [
+            ("stock.location", _SCRAP_LOCATION_DOMAIN),
+            ("stock.location", _INTERNAL_LOCATION_DOMAIN),
+            ("product.product", _AKKU_DOMAIN),
+        ]
+        if self.api.multicall_supported:
+            scrap, internal, akku = self.api.multicall([
+                (model, "search", [domain], {"limit": 1}) for model, domain in lookups
+            ])
+        else:
+            scrap, internal, akku = (
+                self.api.search(model, domain, limit=1) for model, domain in lookups
+            )
+        if scrap and self._scrap_location_id is None:
+            self._scrap_location_id = scrap[0]
+        if self._default_internal_location_id is _MISSING:
+            self._default_internal_location_id = internal[0] if internal else None
+        if akku:
+            self._product_ids.setdefault("Akku", akku[0])
+
     def _get_or_create_scrap_location(self) -> int:
         """
         Stellt ein Schrottlager (stock.location, usage='inventory') bereit.
         """
-        existing = self.api.search_read(
-            "stock.location",
-            [["usage", "=", "inventory"], ["name", "=", "Scrap"]],
-            ["id"],
-            limit=1,
-        )
+        if self._scrap_location_id is not None:
+            return self._scrap_location_id
+        existing = self.api.search("stock.location", _SCRAP_LOCATION_DOMAIN, limit=1)
         if existing:
-            return existing[0]["id"]
+            self._scrap_location_id = existing[0]
+            return self._scrap_location_id
 
         vals: Dict[str, object] = {
             "name": "Scrap",
             "usage": "inventory",
         }
         loc_id = self.api.create("stock.location", vals)
-        if isinstance(loc_id, (list, tuple)):
-            loc_id = loc_id[0]
-        return int(loc_id)
+        self._scrap_location_id = int(loc_id)
+        return self._scrap_location_id
 
     def _ensure_demo_product_akku(self) -> int:
         """
         Sucht das Produkt 'Akku' oder legt es vereinfacht an.
         """
-        prod = self.api.search_read(
-            "product.product",
-            [["name", "=", "Akku"]],
-            ["id"],
-            limit=1,
-        )
+        cached = self._product_ids.get("Akku")
+        if cached is not None:
+            return cached
+        prod = self.api.search("product.product", _AKKU_DOMAIN, limit=1)
         if prod:
-            return prod[0]["id"]
+            self._product_ids["Akku"] = prod[0]
+            return prod[0]
 
         prod_id = self.api.create(
             "product.product",
@@ -88,23 +139,18 @@ class InventoryFlow:
                 "type": "consu",
             },
         )
-        if isinstance(prod_id, (list, tuple)):
-            prod_id = prod_id[0]
-        return int(prod_id)
+        self._product_ids["Akku"] = int(prod_id)
+        return self._product_ids["Akku"]
 
     def _get_default_internal_location(self) -> Optional[int]:
         """
         Liefert einen internen Lagerort (z. B. Hauptlager) oder None.
         """
-        locations = self.api.search_read(
-            "stock.location",
-            [["usage", "=", "internal"]],
-            ["id", "name"],
-            limit=1,
-        )
-        if not locations:
-            return None
-        return locations[0]["id"]
+        if self._default_internal_location_id is not _MISSING:
+            return self._default_internal_location_id
+        locations = self.api.search("stock.location", _INTERNAL_LOCATION_DOMAIN, limit=1)
+        self._default_internal_location_id = locations[0] if locations else None
+        return self._default_internal_location_id
 
     def _run_inventory_adjustment(
         self, product_id: int, location_id: int, new_qty: float
@@ -112,44 +158,58 @@ class InventoryFlow:
         """
         Legt eine Inventur an, setzt die gezählte Menge und validiert.
         """
-        inventory_vals: Dict[str, object] = {
-            "name": f"Demo-Inventur {datetime.now().isoformat(timespec='seconds')}",
-            "product_ids": [(6, 0, [product_id])],
-            "location_ids": [(6, 0, [location_id])],
-        }
+        return self.run_inventory_adjustments([(product_id, location_id, new_qty)])[0]
+
+    def run_inventory_adjustments(
+        self, items: List[Tuple[int, int, float]]
+    ) -> List[int]:
+        """
+        Mehrere Inventuren (product_id, location_id, gezählte Menge) auf einmal.
 
-        inv_id = self.api.create("stock.inventory", inventory_vals)
-        if isinstance(inv_id, (list, tuple)):
-            inv_id = inv_id[0]
+        Unabhängig von der Anzahl: ein create, ein Roundtrip action_start,
+        ein search_read der Linien, writes gruppiert nach Menge, ein
+        Roundtrip action_validate. Die Aktionen laufen pro Inventur (Odoo
+        prüft ensure_one), aber gebündelt über multicall.
 
-        # Inventur starten
-        self.api.call(
+        Returns: Inventur-IDs in Reihenfolge von items.
+        """
+        if not items:
+            return []
+        stamp = datetime.now().isoformat(timespec='seconds')
+        inv_ids = self.api.create_many(
             "stock.inventory",
-            "action_start",
-            [[inv_id]],
+            [
+                {
+                    "name": f"Demo-Inventur {stamp}" if len(items) == 1 else f"Demo-Inventur {stamp} #{pos}",
+                    "product_ids": [(6, 0, [product_id])],
+                    "location_ids": [(6, 0, [location_id])],
+                }
+                for pos, (product_id, location_id, _) in enumerate(items, 1)
+            ],
         )
 
-        # Inventurlinien lesen und gezählte Menge setzen
+        # Inventuren starten
+        self.api.multicall([("stock.inventory", "action_start", [[inv_id]], {}) for inv_id in inv_ids])
+
+        # Inventurlinien lesen und gezählte Menge setzen (ein write je Menge)
+        qty_by_inventory = {inv_id: qty for inv_id, (_, _, qty) in zip(inv_ids, items)}
         lines = self.api.search_read(
             "stock.inventory.line",
-            [["inventory_id", "=", inv_id]],
-            ["id"],
+            [["inventory_id", "in", inv_ids]],
+            ["inventory_id"],
         )
-        for line in lines:
-            self.api.write(
-                "stock.inventory.line",
-                [line["id"]],
-                {"product_qty": new_qty},
-            )
-
-        # Inventur validieren
-        self.api.call(
-            "stock.inventory",
-            "action_validate",
-            [[inv_id]],
+        self.api.write_grouped(
+            "stock.inventory.line",
+            [
+                (line["id"], {"product_qty": qty_by_inventory[line["inventory_id"][0]]})
+                for line in lines
+            ],
         )
 
-        return int(inv_id)
+        # Inventuren validieren
+        self.api.multicall([("stock.inventory", "action_validate", [[inv_id]], {}) for inv_id in inv_ids])
+
+        return [int(inv_id) for inv_id in inv_ids]
 
     # -------------------------------------------------------------------------
     # Demo: Inventur
@@ -160,6 +220,7 @@ class InventoryFlow:
         Simuliert eine Inventur für das Demo-Produkt 'Akku'.
         """
         log_info("Demo-Inventurfall wird ausgeführt...")
+        self._prefetch_lookups()  # Produkt + Lagerort gleichzeitig statt nacheinander
 
         prod_id = self._ensure_demo_product_akku()
         location_id = self._get_default_internal_location()
@@ -176,11 +237,7 @@ class InventoryFlow:
             inv_id = self._run_inventory_adjustment(
                 product_id=prod_id, location_id=location_id, new_qty=10.0
             )
-            log_success(
-                f"Demo-Inventurfall für Produkt 'Akku' ausgeführt "
-                f"(Inventur-ID {inv_id}, Lagerort-ID {location_id})."
-            )
-        except Exception as exc:
+        except RPC_ERRORS as exc:
             log_warn(
                 "Inventur konnte nicht vollständig automatisch angelegt/validiert werden. "
                 "Bitte Odoo-Version und stock.inventory-Konfiguration prüfen."
@@ -189,25 +246,40 @@ class InventoryFlow:
             log_success(
                 "Demo-Inventurfall dokumentiert (Inventur nur teilweise ausgeführt)."
             )
+        else:
+            log_success(
+                f"Demo-Inventurfall für Produkt 'Akku' ausgeführt "
+                f"(Inventur-ID {inv_id}, Lagerort-ID {location_id})."
+            )
 
     # -------------------------------------------------------------------------
     # Demo: Ausschuss über stock.scrap
     # -------------------------------------------------------------------------
 
-    def scrap_product(self, product_name: str, quantity: float) -> None:
+    def _prefetch_products(self, names: List[str]) -> None:
         """
-        Bucht Ausschuss für ein Produkt in das Schrottlager (stock.scrap).
+        Löst alle noch unbekannten Produktnamen mit EINEM search_read auf.
+
+        Erster Treffer je Name in Server-Reihenfolge (wie limit=1 einzeln).
         """
-        log_info(f"Buche Ausschuss: Produkt '{product_name}', Menge {quantity}...")
+        missing = list(dict.fromkeys(name for name in names if name not in self._product_ids))
+        if not missing:
+            return
+        for row in self.api.search_read("product.product", [["name", "in", missing]], ["id", "name"]):
+            self._product_ids.setdefault(row["name"], row["id"])
 
-        prod = self.api.search_read(
-            "product.product",
-            [["name", "=", product_name]],
-            ["id"],
-            limit=1,
-        )
+    def _get_or_create_scrap_product(self, product_name: str) -> int:
+        """
+        Sucht das Produkt per Name oder legt ein Demo-Produkt an (gemerkt pro Name).
+        """
+        cached = self._product_ids.get(product_name)
+        if cached is not None:
+            return cached
 
-        if not prod:
+        prod = self.api.search("product.product", [["name", "=", product_name]], limit=1)
+        if prod:
+            prod_id = prod[0]
+        else:
             prod_id = self.api.create(
                 "product.product",
                 {
@@ -216,14 +288,20 @@ class InventoryFlow:
                     "type": "consu",
                 },
             )
-            if isinstance(prod_id, (list, tuple)):
-                prod_id = prod_id[0]
             prod_id = int(prod_id)
             log_info(
                 f"Demo-Produkt '{product_name}' für Ausschuss angelegt (ID {prod_id})."
             )
-        else:
-            prod_id = prod[0]["id"]
+        self._product_ids[product_name] = prod_id
+        return prod_id
+
+    def scrap_product(self, product_name: str, quantity: float) -> None:
+        """
+        Bucht Ausschuss für ein Produkt in das Schrottlager (stock.scrap).
+        """
+        log_info(f"Buche Ausschuss: Produkt '{product_name}', Menge {quantity}...")
+
+        prod_id = self._get_or_create_scrap_product(product_name)
 
         qty = safe_float(quantity, default=0.0, allow_negative=False)
         if qty <= 0.0:
@@ -242,25 +320,59 @@ class InventoryFlow:
 
         try:
             scrap_id = self.api.create("stock.scrap", vals)
-            if isinstance(scrap_id, (list, tuple)):
-                scrap_id = scrap_id[0]
-            scrap_id = int(scrap_id)
-
             self.api.call(
                 "stock.scrap",
                 "action_validate",
                 [[scrap_id]],
             )
-            log_success(
-                f"Ausschuss für '{product_name}' (Menge {qty}) gebucht "
-                f"(Scrap-ID {scrap_id})."
+        except RPC_ERRORS as exc:
+            log_warn(
+                "Ausschuss konnte nicht vollständig automatisch gebucht werden. "
+                "Bitte Odoo-Version und stock.scrap-Konfiguration prüfen."
             )
-        except Exception as exc:
+            log_warn(f"Details: {exc}")
+            return
+        log_success(
+            f"Ausschuss für '{product_name}' (Menge {qty}) gebucht "
+            f"(Scrap-ID {scrap_id})."
+        )
+
+    def scrap_products(self, items: List[Tuple[str, float]]) -> List[int]:
+        """
+        Bucht Ausschuss für mehrere (Produktname, Menge) auf einmal.
+
+        Ein create für alle stock.scrap, die Validierung pro Scrap gebündelt
+        in einem multicall. Ungültige Mengen werden übersprungen.
+
+        Returns: Scrap-IDs der gebuchten Positionen.
+        """
+        self._prefetch_products([product_name for product_name, _ in items])
+        vals_list = []
+        for product_name, quantity in items:
+            qty = safe_float(quantity, default=0.0, allow_negative=False)
+            if qty <= 0.0:
+                log_warn(f"Ausschussmenge für '{product_name}' ist 0 oder ungültig; übersprungen.")
+                continue
+            vals_list.append({
+                "product_id": self._get_or_create_scrap_product(product_name),
+                "scrap_qty": qty,
+                "scrap_location_id": self._get_or_create_scrap_location(),
+            })
+        if not vals_list:
+            return []
+
+        try:
+            scrap_ids = self.api.create_many("stock.scrap", vals_list)
+            self.api.multicall([("stock.scrap", "action_validate", [[scrap_id]], {}) for scrap_id in scrap_ids])
+        except RPC_ERRORS as exc:
             log_warn(
                 "Ausschuss konnte nicht vollständig automatisch gebucht werden. "
                 "Bitte Odoo-Version und stock.scrap-Konfiguration prüfen."
             )
             log_warn(f"Details: {exc}")
+            return []
+        log_success(f"{len(scrap_ids)} Ausschuss-Buchungen gebucht.")
+        return scrap_ids
 
     # -------------------------------------------------------------------------
     # Kombinierte Demo
@@ -105,12 +105,14 @@ class KPIExtractor:
 
         Variante ohne Custom-Feld:
         - nutzt ein bestehendes Feld wie 'quality_state' ('passed' / 'failed').
+        - gezählt wird serverseitig per read_group (eine Zeile je Status),
+          ohne 1000er-Limit und ohne die Checks einzeln zu übertragen.
 
         summary:
         - checks_total, checks_passed, checks_failed, pass_rate, fail_rate
 
         details:
-        - Liste der quality.check-Datensätze
+        - Anzahl je quality_state ([{"quality_state", "__count"}, ...])
         """
         log_info("Berechne QC-Kennzahlen...")
 
@@ -118,65 +120,49 @@ class KPIExtractor:
         if product_id:
             domain.append(["product_id", "=", product_id])
 
+        empty = {
+            "summary": {
+                "checks_total": 0,
+                "checks_passed": 0,
+                "checks_failed": 0,
+                "pass_rate": 0.0,
+                "fail_rate": 0.0,
+            },
+            "details": [],
+        }
+
         try:
-            checks = self.api.search_read(
+            groups = self.api.read_group(
                 "quality.check",
                 domain,
-                ["id", "product_id", "point_id", "quality_state"],
-                limit=1000,
+                ["quality_state"],
+                ["quality_state"],
+                lazy=False,
             )
         except Exception:
             log_warn(
                 "[KPI:QC] quality.check oder Feld 'quality_state' nicht lesbar – "
                 "QC-Kennzahlen = 0."
             )
-            return {
-                "summary": {
-                    "checks_total": 0,
-                    "checks_passed": 0,
-                    "checks_failed": 0,
-                    "pass_rate": 0.0,
-                    "fail_rate": 0.0,
-                },
-                "details": [],
-            }
-
-        if not checks or "quality_state" not in checks[0]:
-            log_warn(
-                "[KPI:QC] Feld 'quality_state' auf quality.check nicht vorhanden – "
-                "QC-Kennzahlen = 0."
-            )
-            return {
-                "summary": {
-                    "checks_total": 0,
-                    "checks_passed": 0,
-                    "checks_failed": 0,
-                    "pass_rate": 0.0,
-                    "fail_rate": 0.0,
-                },
-                "details": [],
-            }
-
-        total = len(checks)
-        passed = sum(1 for c in checks if c.get("quality_state") == "passed")
-        failed = sum(1 for c in checks if c.get("quality_state") == "failed")
-
-        pass_rate = (passed / total) if total else 0.0
-        fail_rate = (failed / total) if total else 0.0
+            return empty
 
-        for c in checks:
-            log_info(
-                f"[KPI:QC:DETAIL] QC {c['id']} "
-                f"product={c.get('product_id')} "
-                f"point={c.get('point_id')} "
-                f"state={c.get('quality_state')}"
-            )
+        counts = {g.get("quality_state"): g.get("__count", 0) for g in groups}
+        total = sum(counts.values())
+        passed = counts.get("passed", 0)
+        failed = counts.get("failed", 0)
 
         if total == 0:
             log_warn(
                 "[KPI:QC] Keine Quality-Checks gefunden – "
                 "QC-Raten = 0, nicht aussagekräftig."
             )
+            return empty
+
+        pass_rate = passed / total
+        fail_rate = failed / total
+
+        for state, count in counts.items():
+            log_info(f"[KPI:QC:DETAIL] state={state} count={count}")
 
         return {
             "summary": {
@@ -186,7 +172,7 @@ class KPIExtractor:
                 "pass_rate": pass_rate,
                 "fail_rate": fail_rate,
             },
-            "details": checks,
+            "details": groups,
         }
 
     # -------------------------------------------------------------------------
@@ -197,6 +183,11 @@ class KPIExtractor:
         """
         Liefert Lagerkennzahlen.
 
+        qty_available ist nicht gespeichert und damit nicht per read_group
+        aggregierbar – summiert werden daher die Quants interner Lagerorte
+        (Basis von qty_available), gruppiert nach Produkt, absteigend sortiert.
+        Ein RPC, eine Zeile je Produkt mit Bestand, kein 1000er-Limit.
+
         summary:
         - products_with_stock
         - total_stock_qty
@@ -206,25 +197,31 @@ class KPIExtractor:
         """
         log_info("Berechne Lager-Kennzahlen...")
 
-        products = self.api.search_read(
-            "product.product",
-            [],
-            ["id", "product_tmpl_id", "qty_available"],
-            limit=1000,
+        groups = self.api.read_group(
+            "stock.quant",
+            [["location_id.usage", "=", "internal"]],
+            ["product_id", "quantity:sum"],
+            ["product_id"],
+            orderby="quantity desc",
+            lazy=False,
         )
 
-        stock_values = [p.get("qty_available", 0.0) for p in products]
-        positive = [q for q in stock_values if q > 0]
-        total_stock = sum(stock_values)
-
-        products_sorted = sorted(
-            products, key=lambda p: p.get("qty_available", 0.0), reverse=True
-        )
+        products_sorted = [
+            {
+                "id": g["product_id"][0],
+                "name": g["product_id"][1],
+                "qty_available": g.get("quantity") or 0.0,
+            }
+            for g in groups
+            if g.get("product_id")
+        ]
+        positive = sum(1 for p in products_sorted if p["qty_available"] > 0)
+        total_stock = sum(p["qty_available"] for p in products_sorted)
 
         for p in products_sorted[:10]:
             log_info(
-                f"[KPI:INV:DETAIL] Prod {p['id']} tmpl={p.get('product_tmpl_id')} "
-                f"qty={p.get('qty_available', 0.0)}"
+                f"[KPI:INV:DETAIL] Prod {p['id']} {p['name']} "
+                f"qty={p['qty_available']}"
             )
 
         if not positive:
@@ -235,7 +232,7 @@ class KPIExtractor:
 
         return {
             "summary": {
-                "products_with_stock": len(positive),
+                "products_with_stock": positive,
                 "total_stock_qty": total_stock,
             },
             "top_products": products_sorted[:20],
@@ -259,43 +256,37 @@ class KPIExtractor:
             limit=20,
         )
 
+        if not orders:
+            log_warn("[KPI:LT] Kein SO mit abgeschlossener Lieferung gefunden – Lead-Time = 0.")
+            return 0.0
+
+        # Letzte date_done je SO (origin) für alle Orders in EINEM read_group
+        # statt einer Picking-Suche pro SO
+        groups = self.api.read_group(
+            "stock.picking",
+            [
+                ["origin", "in", [so["name"] for so in orders]],
+                ["picking_type_id.code", "=", "outgoing"],
+                ["state", "=", "done"],
+            ],
+            ["origin", "date_done:max"],
+            ["origin"],
+            lazy=False,
+        )
+        last_done = {g["origin"]: g.get("date_done") for g in groups}
+
         for so in orders:
             so_name = so["name"]
             start_raw = so.get("create_date")
-            if not start_raw:
+            end_raw = last_done.get(so_name)
+            if not start_raw or not end_raw:
                 continue
             try:
                 dt_start = datetime.fromisoformat(start_raw)
+                dt_end = datetime.fromisoformat(end_raw)
             except Exception:
                 continue
 
-            pickings = self.api.search_read(
-                "stock.picking",
-                [
-                    ["origin", "=", so_name],
-                    ["picking_type_id.code", "=", "outgoing"],
-                    ["state", "=", "done"],
-                ],
-                ["id", "date_done"],
-                limit=10,
-            )
-            if not pickings:
-                continue
-
-            dates_done: List[datetime] = []
-            for p in pickings:
-                d = p.get("date_done")
-                if not d:
-                    continue
-                try:
-                    dates_done.append(datetime.fromisoformat(d))
-                except Exception:
-                    continue
-
-            if not dates_done:
-                continue
-
-            dt_end = max(dates_done)
             lead_days = (dt_end - dt_start).total_seconds() / 86400.0
             log_info(f"[KPI:LT] Lead Time für SO {so_name}: {lead_days:.2f} Tage.")
             return lead_days
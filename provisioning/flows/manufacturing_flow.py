@@ -17,7 +17,7 @@ from __future__ import annotations
 
 from typing import List, Dict, Any
 
-from provisioning.client import OdooClient
+from provisioning.client import EmptyCreateResult, OdooClient
 from provisioning.utils import log_info, log_success, log_warn
 
 
@@ -62,11 +62,14 @@ class ManufacturingFlow:
                     # Optional: "origin": sale.order-Name etc.
                 }
 
-                mo_id = self.api.create("mrp.production", vals)
-                if isinstance(mo_id, (list, tuple)):
-                    if not mo_id:
-                        continue
-                    mo_id = mo_id[0]
+                try:
+                    mo_id = self.api.create("mrp.production", vals)
+                except EmptyCreateResult:
+                    log_warn(
+                        f"mrp.production für Produkt {product_id} "
+                        f"(Menge {qty}) konnte nicht angelegt werden."
+                    )
+                    continue
                 mo_id = int(mo_id)
 
                 mo_ids.append(mo_id)
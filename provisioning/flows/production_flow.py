@@ -16,14 +16,11 @@ Nutzt:
 
 from __future__ import annotations
 
-from datetime import datetime  # aktuell nur für mögliche Erweiterungen
-from typing import Literal
-
 from provisioning.client import OdooClient
 from provisioning.utils import log_info, log_success, log_warn
 from provisioning.config import UMH_EVENTS_PRODUCTION_FILE
 
-from provisioning.flows.production_routing import get_routing, VariantName
+from provisioning.flows.production_routing import get_routing, ROUTING_TOTALS, VariantName
 from provisioning.integration.umh_events import UMHEventManager, EventType
 from provisioning.integration.umh_client_sim import UMHClientSimulator
 
@@ -52,8 +49,9 @@ class ProductionFlow:
         )
 
         ops = get_routing(variant)
-        total_setup = 0.0
-        total_run = 0.0
+        # Summen sind beim Import vorberechnet (Laufzeit je Stück × Menge)
+        total_setup, run_per_unit = ROUTING_TOTALS[variant]
+        total_run = run_per_unit * quantity
 
         # MO-Start-Event (ohne echte MO-ID -> Dummy -1)
         mo_start = self.umh_manager.create_mo_event(
@@ -63,8 +61,6 @@ class ProductionFlow:
 
         for op in ops:
             log_info(f"Operation {op.seq}: {op.name} auf {op.workcenter_code}")
-            total_setup += op.setup_time_min
-            total_run += op.run_time_min * quantity
 
             # Beispiel: Qualitäts-Event bei End-Qualitätskontrolle
             if op.seq == 120:
@@ -19,13 +19,13 @@ Jede Operation enthält:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Dict, Literal
+from typing import List, Dict, Literal, Tuple
 
 
 VariantName = Literal["spartan", "balance", "lightweight"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OperationDef:
     seq: int
     name: str
@@ -82,6 +82,19 @@ ROUTINGS: Dict[VariantName, List[OperationDef]] = {
 }
 
 
+# Einmal beim Import: nach seq sortiert + Summen (Rüstzeit, Laufzeit je Stück)
+_SORTED_ROUTINGS: Dict[str, Tuple[OperationDef, ...]] = {
+    variant: tuple(sorted(ops, key=lambda o: o.seq)) for variant, ops in ROUTINGS.items() if ops
+}
+ROUTING_TOTALS: Dict[str, Tuple[float, float]] = {
+    variant: (
+        sum(op.setup_time_min for op in ops),
+        sum(op.run_time_min for op in ops),
+    )
+    for variant, ops in _SORTED_ROUTINGS.items()
+}
+
+
 def get_routing(variant: VariantName) -> List[OperationDef]:
     """
     Liefert die Routing-Operationen für eine gegebene Variante.
@@ -89,10 +102,9 @@ def get_routing(variant: VariantName) -> List[OperationDef]:
     Rückgabe:
     - Nach seq aufsteigend sortierte Liste von OperationDef.
     """
-    ops = ROUTINGS.get(variant)
+    ops = _SORTED_ROUTINGS.get(variant)
     if not ops:
         raise ValueError(
             f"Keine Routingdefinition für Variante '{variant}' gefunden."
         )
-    # vorsichtshalber nach seq sortieren
-    return sorted(ops, key=lambda o: o.seq)
+    return list(ops)
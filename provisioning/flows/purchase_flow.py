@@ -64,12 +64,6 @@ class PurchaseFlow:
         }
 
         po_id = self.api.create("purchase.order", po_vals)
-        if isinstance(po_id, (list, tuple)):
-            if not po_id:
-                raise RuntimeError(
-                    "Erstellung von purchase.order hat keine ID geliefert."
-                )
-            po_id = po_id[0]
         po_id = int(po_id)
 
         line_vals: Dict[str, Any] = {
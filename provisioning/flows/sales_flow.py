@@ -55,8 +55,6 @@ class SalesFlow:
             ],
         }
         order_id = self.api.create("sale.order", order_vals)
-        if isinstance(order_id, (list, tuple)):
-            order_id = order_id[0]
         return int(order_id)
 
     def _confirm_order(self, order_id: int) -> None:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 
-from provisioning.client import OdooClient
+from provisioning.client import EmptyCreateResult, OdooClient
 from provisioning.utils import log_info, log_warn
 
 
@@ -44,12 +44,11 @@ class TraceabilityManager:
             "name": serial,
             "product_id": product_id,
         }
-        lot_id = self.api.create("stock.lot", vals)
-        if isinstance(lot_id, (list, tuple)):
-            if not lot_id:
-                log_warn("stock.lot konnte nicht angelegt werden.")
-                return None
-            lot_id = lot_id[0]
+        try:
+            lot_id = self.api.create("stock.lot", vals)
+        except EmptyCreateResult:
+            log_warn("stock.lot konnte nicht angelegt werden.")
+            return None
         lot_id = int(lot_id)
         log_info(
             f"Seriennummer '{serial}' für Produkt {product_id} "
@@ -2,46 +2,70 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Deque, Dict, List, Optional
 from pathlib import Path
-import json
-
 from provisioning.config import UMH_EVENTS_ENDTOEND_FILE
+from provisioning.utils import log_warn, write_json
 
 
 EVENT_FILE = Path(UMH_EVENTS_ENDTOEND_FILE)
+# Obergrenze für gepufferte Events: lange Läufe wachsen nicht unbegrenzt,
+# bei Überlauf fallen die ältesten Events heraus (gezählt in `dropped`)
+MAX_BUFFERED_EVENTS = 10_000
 
 
 class UMHClientSimulator:
     """
     Simuliert einen UMH-Client (MQTT/HTTP) durch pures Dateischreiben.
-    Events werden in-memory gesammelt und können als JSON-Datei exportiert werden.
+    Events werden in-memory gesammelt (höchstens max_events, älteste fallen
+    heraus und werden gezählt) und können als JSON-Datei exportiert werden.
     """
 
-    def __init__(self, use_mqtt: bool = False, output_file: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        use_mqtt: bool = False,
+        output_file: Optional[str] = None,
+        max_events: int = MAX_BUFFERED_EVENTS,
+    ) -> None:
         self.use_mqtt = use_mqtt
         self.output_file = Path(output_file) if output_file else EVENT_FILE
-        self.events_sent: List[Dict] = []
+        self.events_sent: Deque[Dict] = deque(maxlen=max_events)
+        self.dropped = 0
+
+    def _count_dropped(self, incoming: int) -> None:
+        overflow = len(self.events_sent) + incoming - self.events_sent.maxlen
+        if overflow <= 0:
+            return
+        if not self.dropped:
+            log_warn(
+                f"UMH-Event-Puffer voll ({self.events_sent.maxlen}); "
+                f"älteste Events werden verworfen."
+            )
+        self.dropped += overflow
 
     def send_event(self, event: Dict) -> bool:
+        self._count_dropped(1)
         self.events_sent.append(event)
         return True
 
     def send_events_batch(self, events: List[Dict]) -> bool:
-        for evt in events:
-            self.send_event(evt)
+        events = list(events)
+        self._count_dropped(len(events))
+        self.events_sent.extend(events)
         return True
 
     def get_sent_events(self) -> List[Dict]:
         return list(self.events_sent)
 
     def export_to_file(self) -> bool:
+        """Schreibt {"dropped": n, "events": [...]} – dropped > 0 heißt: Historie gekürzt."""
         try:
-            with self.output_file.open("w", encoding="utf-8") as f:
-                json.dump(self.events_sent, f, ensure_ascii=False, indent=2)
+            write_json(self.output_file, {"dropped": self.dropped, "events": list(self.events_sent)})
             return True
         except OSError:
             return False
 
     def clear_events(self) -> None:
         self.events_sent.clear()
+        self.dropped = 0
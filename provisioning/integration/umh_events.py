@@ -30,6 +30,9 @@ class EventType(Enum):
 class UMHEvent:
     """Repräsentiert ein einzelnes Event, das an UMH gesendet werden kann."""
 
+    # Events werden massenhaft in UMHEventManager.events gepuffert → kein __dict__
+    __slots__ = ("event_type", "timestamp", "payload")
+
     def __init__(self, event_type: EventType, timestamp: datetime, payload: Dict) -> None:
         self.event_type = event_type
         self.timestamp = timestamp
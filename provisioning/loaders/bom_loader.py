@@ -26,6 +26,8 @@ class BomLoader:
         self._template_cache: Dict[str, Dict[str, Any]] = {}
         self._variant_cache: Dict[str, List[Dict[str, Any]]] = {}
         self._bom_cache: Dict[str, int] = {}
+        self._uom_id: Optional[int] = None
+        self._categ_id: Optional[int] = None
 
     def _safe_call(self, model: str, method: str, vals: list, identifier: str, operation: str = "CREATE") -> int:
         """🔒 Safe RPC mit Retries."""
@@ -45,19 +47,26 @@ class BomLoader:
         return 0
 
     def _get_safe_categ(self) -> int:
-        """✅ Purchased Components > Goods > All."""
+        """✅ Purchased Components > Goods > All (einmal pro Lauf ermittelt)."""
+        if self._categ_id is not None:
+            return self._categ_id
         for categ_name in ["Purchased Components", "Goods"]:
             categ_ids = self.client.search("product.category", [("name", "=", categ_name)], limit=1)
             if categ_ids:
-                return categ_ids[0]
+                self._categ_id = categ_ids[0]
+                return self._categ_id
         log_warn("⚠️ Purchased Components nicht gefunden → All")
-        return 1  # All
+        self._categ_id = 1  # All
+        return self._categ_id
 
     def _ensure_uom(self) -> int:
+        if self._uom_id is not None:
+            return self._uom_id
         res = self.client.search_read("uom.uom", [("name", "in", ["Units", "stk", "Piece"])], ["id"], limit=1)
         if not res:
             raise RuntimeError("UoM 'Units/stk' not found")
-        return res[0]["id"]
+        self._uom_id = res[0]["id"]
+        return self._uom_id
 
     def _find_product_tmpl(self, default_code: str) -> Optional[int]:
         if default_code in self._template_cache:
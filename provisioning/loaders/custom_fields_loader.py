@@ -14,7 +14,7 @@ from typing import Optional
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 sys.path.insert(0, BASE_DIR)
 
-from provisioning.config import OdooConfig  # ← DEINE Config.py!
+from provisioning.config import get_odoo_config  # ← DEINE Config.py!
 from provisioning.client import OdooClient
 
 # Utils Fallback
@@ -130,21 +130,13 @@ def create_custom_fields(client: OdooClient) -> bool:
 if __name__ == "__main__":
     try:
         # 🔥 AUTO-CONFIG MIT DEINER .env + config.py
-        config = OdooConfig.from_env()
+        config = get_odoo_config()
         log_info(f"🔗 {config.url}/{config.db} (via .env)")
         
-        client = OdooClient(
-            url=config.url,
-            db=config.db,
-            username=config.user,
-            password=config.password
-        )
+        client = OdooClient(config)
         
-        # Auth Test
-        client.models.execute_kw(
-            config.db, client.uid, config.password,
-            'common', 'login', [config.db, config.user, config.password]
-        )
+        # Auth Test (authenticate läuft einmal, uid wird gecacht)
+        client.uid
         
         create_custom_fields(client)
         
@@ -11,11 +11,14 @@ from provisioning.utils import (
     log_warn,
     bump_progress,
 )
-from provisioning.config import MAILSERVERS_CONFIG  # ← neu!
+from provisioning.config import mail_servers  # ← neu!
+
+
+_PLACEHOLDER = re.compile(r"\[(.*?)\]", re.ASCII)
 
 
 class MailServerLoader:
-    """Legt Odoo Mail-Server aus config.py (MAILSERVERS_CONFIG) per API an."""
+    """Legt Odoo Mail-Server aus config.py (mail_servers()) per API an."""
 
     def __init__(self, client: OdooClient, base_data_dir: str) -> None:
         self.client = client
@@ -23,7 +26,8 @@ class MailServerLoader:
 
     def _resolve_env_vars(self, value: str) -> str:
         """Ersetzt [VARNAME]-Platzhalter durch os.getenv(VARNAME)."""
-        pattern = r"\[(.*?)\]"
+        if "[" not in value:
+            return value  # häufigster Fall: kein Platzhalter, kein Regex
         def repl(match):
             var_name = match.group(1)
             resolved = os.getenv(var_name)
@@ -31,7 +35,7 @@ class MailServerLoader:
                 log_warn(f"[ENV:MISSING] '{var_name}' nicht gefunden → Platzhalter belassen")
                 return match.group(0)
             return resolved
-        return re.sub(pattern, repl, value)
+        return _PLACEHOLDER.sub(repl, value)
 
     def _ensure_outgoing_server(self, smtp_config: Dict[str, Any]) -> int:
         domain = [("name", "=", smtp_config["name"])]
@@ -76,7 +80,7 @@ class MailServerLoader:
 
     def load_from_config(self) -> None:
         log_header("Mail-Server aus config.py laden")
-        for config in MAILSERVERS_CONFIG:
+        for config in mail_servers():
             odoo_vals = {}
             for key, value in config.items():
                 if isinstance(value, str):
@@ -1,6 +1,4 @@
 # provisioning/loaders/manufacturing_config_loader.py
-import os
-from typing import Dict, Any
 from provisioning.utils.csv_cleaner import join_path
 from ..client import OdooClient
 from provisioning.utils import log_header, log_info, log_success, log_warn
@@ -9,8 +7,7 @@ class ManufacturingConfigLoader:
     def __init__(self, client: OdooClient, base_data_dir: str) -> None:
         self.client = client
         self.config_dir = join_path(base_data_dir, "manufacturing_config")
-        company_ids = self.client.search("res.company", [], limit=1)
-        self.company_id = company_ids[0] if company_ids else 1
+        self.company_id = self.client.company_id
 
     def _find_or_create_sequence(self, prefix: str, padding: int = 5) -> int:
         """ir.sequence für MO-References (company-scope)."""
@@ -15,7 +15,6 @@ Variant Codes Assigned: 576 (100%)
 """
 
 import os
-import json
 import re
 import time
 from typing import Dict, Any, Optional, List
@@ -23,7 +22,7 @@ from decimal import Decimal
 from xmlrpc.client import Fault
 
 from ..client import OdooClient
-from provisioning.utils import log_header, log_success, log_info, log_warn, log_error
+from provisioning.utils import log_header, log_success, log_info, log_warn, log_error, write_json
 from provisioning.utils.csv_cleaner import csv_rows, join_path
 
 
@@ -93,31 +92,56 @@ COLOR_MAP = {
     '004': 'Blau', '005': 'Braun', '006': 'Orange', '007': 'Schwarz'
 }
 
+# Einheiten-Kürzel (lowercase) → uom.uom-Name
+UOM_NAMES = {'stk': 'Units', 'kg': 'kg', 'm': 'm', 'g': 'g', 'm2': 'm²'}
+
+# Kategorie-Schlüssel → product.category-Name
+CATEGORY_NAMES = {
+    'KAEUFER': 'Purchased Components',
+    'EIGENFERTIG': 'Manufactured Components',
+    'FERTIGWARE': 'Drohne',
+}
+
+# Prefix → Kategorie/Routing-Hint einmalig beim Import aufgelöst (Hot-Path pro CSV-Zeile)
+_CATEGORY_BY_PREFIX: Dict[str, str] = {}
+for _cat_key, _cat_data in COMPONENT_CATEGORIES.items():
+    for _prefix in _cat_data['codes']:
+        _CATEGORY_BY_PREFIX.setdefault(_prefix, _cat_key)
+
+# Listenpreis-Faktoren als Decimal, nicht pro Zeile aus float/str gebaut
+_PRICE_FACTORS: Dict[str, Decimal] = {
+    cat_key: Decimal(str(cat_data['price_factor']))
+    for cat_key, cat_data in COMPONENT_CATEGORIES.items()
+    if cat_data.get('set_list_price')
+}
+
+_ROUTING_HINTS = {
+    '018': '3D_DRUCK_HAUBE', '019': '3D_DRUCK_GRUNDPLATTE', '020': '3D_DRUCK_RAHMEN',
+    '021': 'VERPACKUNG_KAUFARTIKEL', '022': 'FUELLMATERIAL_KAUFARTIKEL',
+    '029': 'DROHNEN_ENDMONTAGE',
+}
+
 def get_component_category(code: str) -> str:
-    prefix = code.split('.')[0]
-    for cat_key, cat_data in COMPONENT_CATEGORIES.items():
-        if prefix in cat_data['codes']:
-            return cat_key
-    return 'KAEUFER'
+    return _CATEGORY_BY_PREFIX.get(code.split('.')[0], 'KAEUFER')
 
 def get_component_routing_hint(code: str) -> str:
-    prefix = code.split('.')[0]
-    routing_hints = {
-        '018': '3D_DRUCK_HAUBE', '019': '3D_DRUCK_GRUNDPLATTE', '020': '3D_DRUCK_RAHMEN',
-        '021': 'VERPACKUNG_KAUFARTIKEL', '022': 'FUELLMATERIAL_KAUFARTIKEL',
-        '029': 'DROHNEN_ENDMONTAGE',
-    }
-    return routing_hints.get(prefix, 'UNDEFINED')
+    return _ROUTING_HINTS.get(code.split('.')[0], 'UNDEFINED')
+
+# Modul-Konstanten: parse() greift per LOAD_GLOBAL zu statt über die Klasse
+_CENT = Decimal('0.01')
+_PRICE_RE = re.compile(r'(?:EUR|\$)?\s*([0-9]{1,3}(?:[.,][0-9]{3})*[.,][0-9]{2}|[0-9]+[.,][0-9]{2}|[0-9]+)(?:\s*(?:EUR|\$))?', re.IGNORECASE)
 
 class PriceParser:
-    PRICE_REGEX = re.compile(r'(?:EUR|\$)?\s*([0-9]{1,3}(?:[.,][0-9]{3})*[.,][0-9]{2}|[0-9]+[.,][0-9]{2}|[0-9]+)(?:\s*(?:EUR|\$))?', re.IGNORECASE)
+    __slots__ = ()
+    CENT = _CENT
+    PRICE_REGEX = _PRICE_RE
     
     @staticmethod
     def parse(price_str: str) -> Decimal:
         if not price_str:
             raise ValueError("Empty price")
         price_str = price_str.strip()
-        match = PriceParser.PRICE_REGEX.search(price_str)
+        match = _PRICE_RE.search(price_str)
         if not match:
             raise ValueError(f"No price pattern: {price_str}")
         price_part = match.group(1)
@@ -130,7 +154,7 @@ class PriceParser:
         elif ',' in price_part:
             price_part = price_part.replace(',', '.')
         
-        price = Decimal(price_part).quantize(Decimal('0.01'))
+        price = Decimal(price_part).quantize(_CENT)
         if price < 0:
             raise ValueError("Negative price")
         return price
@@ -168,18 +192,18 @@ class ProductsLoaderAdvanced:
         self.drohnen_product_ids = {}
 
     def _safe_call(self, model: str, method: str, vals: list, warehouse_id: str, operation: str = "CREATE") -> int:
-        start_time = time.time()
+        start_time = time.monotonic()
         for retry in range(self.MAX_RETRIES):
             try:
                 if method == 'create':
-                    result = self.client.create(model, vals)
+                    result = self.client.create(model, vals[0])
                 elif method == 'write':
                     result = self.client.write(model, vals[0], vals[1])
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 log_info(f"✅ {warehouse_id} {operation} OK ({elapsed:.1f}s)")
                 return result
             except Fault as e:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 self.stats['rpc_retries'] += 1
                 if "timeout" in str(e).lower() or elapsed > 120:
                     self.stats['rpc_timeouts'] += 1
@@ -218,10 +242,10 @@ class ProductsLoaderAdvanced:
         return 0
 
     def _ensure_uom(self, uom_code: str = 'stk') -> int:
+        uom_code = uom_code.lower()
         if uom_code in self._uom_cache:
             return self._uom_cache[uom_code]
-        uom_map = {'stk': 'Units', 'kg': 'kg', 'm': 'm', 'g': 'g', 'm2': 'm²'}
-        uom_name = uom_map.get(uom_code.lower(), 'Units')
+        uom_name = UOM_NAMES.get(uom_code, 'Units')
         res = self.client.search_read('uom.uom', [('name', '=', uom_name)], ['id'], limit=1)
         if res:
             uom_id = res[0]['id']
@@ -231,12 +255,7 @@ class ProductsLoaderAdvanced:
         return uom_id
 
     def _get_category_id(self, category: str) -> int:
-        cat_map = {
-            'KAEUFER': 'Purchased Components',
-            'EIGENFERTIG': 'Manufactured Components', 
-            'FERTIGWARE': 'Drohne'
-        }
-        cat_name = cat_map.get(category, 'Goods')
+        cat_name = CATEGORY_NAMES.get(category, 'Goods')
         
         if cat_name in self._category_cache:
             return self._category_cache[cat_name]
@@ -897,8 +916,9 @@ class ProductsLoaderAdvanced:
                 if category_data['type'] == 'product':
                     full_vals['type'] = 'product'
                 
-                if category_data.get('set_list_price'):
-                    full_vals['list_price'] = float(cost_price * Decimal(str(category_data['price_factor'])))
+                price_factor = _PRICE_FACTORS.get(category)
+                if price_factor is not None:
+                    full_vals['list_price'] = float(cost_price * price_factor)
                     self.stats['products_with_list_price'] += 1
 
                 self._safe_call('product.template', 'write', [[prod_id], full_vals], 
@@ -950,14 +970,12 @@ class ProductsLoaderAdvanced:
         audit_dir = join_path(self.base_data_dir, 'audit')
         os.makedirs(audit_dir, exist_ok=True)
         
-        with open(join_path(audit_dir, 'products_audit_v423.json'), 'w', encoding='utf-8') as f:
-            json.dump(self.audit_trail, f, indent=2, default=str)
-        with open(join_path(audit_dir, 'products_routing_hints_v423.json'), 'w', encoding='utf-8') as f:
-            json.dump({
-                'stats': self.stats, 
-                'components': self.routing_components, 
-                'drohnen_ids': self.drohnen_product_ids
-            }, f, indent=2, default=str)
+        write_json(join_path(audit_dir, 'products_audit_v423.json'), self.audit_trail, default=str)
+        write_json(join_path(audit_dir, 'products_routing_hints_v423.json'), {
+            'stats': self.stats, 
+            'components': self.routing_components, 
+            'drohnen_ids': self.drohnen_product_ids
+        }, default=str)
         
         log_header("📦 ✅ [SUCCESS] PRODUCTS LOADER v4.2.3 - IMMEDIATE MINIMAL-VARIANTEN")
         for key, value in sorted(self.stats.items()):
@@ -231,9 +231,15 @@ class QualityLoader:
             "Endkontrolle.csv"
         ]
         
+        # Ein scandir statt je Datei ein stat()
+        try:
+            with os.scandir(self.quality_dir) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            present = set()
+
         for fname in qc_files:
-            path = join_path(self.quality_dir, fname)
-            if os.path.exists(path):
+            if fname in present:
                 self._load_qp_file(fname)
                 stats["files_processed"] += 1
             else:
@@ -1,6 +1,5 @@
 import os
-import ast
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List
 from provisioning.utils.csv_cleaner import csv_rows, join_path
 from ..client import OdooClient
 from provisioning.utils import log_header, log_info, log_success, log_warn
@@ -13,8 +12,7 @@ class RoutingLoader:
             base_data_dir or client.base_data_dir,  # ← FIX: client.base_data_dir
             'routing/data'
         )
-        company_ids = self.client.search('res.company', [])
-        self.company_id = company_ids[0] if company_ids else 1
+        self.company_id = self.client.company_id
         log_info(f"[ROUTING:COMPANY] Verwende Company ID {self.company_id}")
 
     def find_location_by_name(self, loc_name: str) -> Optional[int]:
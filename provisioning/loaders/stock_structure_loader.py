@@ -19,8 +19,7 @@ class StockStructureLoader:
         self.base_data_dir = base_data_dir
         self.data_dir = join_path(base_data_dir, "stock_structure")
         
-        company_ids = self.client.search("res.company", [], limit=1)
-        self.company_id = company_ids[0] if company_ids else 1
+        self.company_id = self.client.company_id
         log_info(f"[STOCK:COMPANY] Company ID {self.company_id}")
 
     def safe_float(self, value, default=0.0):
@@ -40,6 +39,30 @@ class StockStructureLoader:
         pt_ids = self.client.search_read("stock.picking.type", domain, ["id"])
         return pt_ids[0]["id"] if pt_ids else 0
 
+    @staticmethod
+    def _parents_first(rows) -> List[Dict[str, str]]:
+        """
+        Sortiert Lagerort-Zeilen nach Tiefe im parent_name-Baum (stabil).
+
+        Die Tiefe wird einmal pro Name über die Elternkette berechnet und
+        gemerkt; danach existiert jeder Parent, bevor sein Kind angelegt wird.
+        """
+        rows = list(rows)
+        parent_of = {row.get("name", "").strip(): row.get("parent_name", "").strip() for row in rows}
+        depth: Dict[str, int] = {}
+
+        def depth_of(name: str) -> int:
+            chain = []
+            while name in parent_of and name not in depth and name not in chain:
+                chain.append(name)
+                name = parent_of[name]
+            base = depth.get(name, 0)
+            for offset, node in enumerate(reversed(chain), 1):
+                depth[node] = base + offset
+            return depth.get(chain[0], base) if chain else base
+
+        return sorted(rows, key=lambda row: depth_of(row.get("name", "").strip()))
+
     def load_locations_from_csv(self, csv_filename: str = "data_normalized/Lagerplätze.csv") -> Dict[str, int]:
         """CSV-Pfad fix: data_normalized/ + Fallback."""
         csv_path = join_path(self.base_data_dir, csv_filename)
@@ -58,7 +81,7 @@ class StockStructureLoader:
         log_header(f"Lagerorte aus {csv_filename}")
         locations: Dict[str, int] = {}
 
-        for row_num, row in enumerate(csv_rows(csv_path, delimiter=";"), 1):
+        for row_num, row in enumerate(self._parents_first(csv_rows(csv_path, delimiter=";")), 1):
             name = row.get("name", "").strip()
             if not name:
                 continue
@@ -114,7 +114,7 @@ class SuppliersLoader:
                         stats['skipped'] += 1
                 else:
                     try:
-                        partner_id = self.client.create("res.partner", [vals])
+                        partner_id = self.client.create("res.partner", vals)
                         self.supplier_cache[name] = partner_id
                         stats['created'] += 1
                         log_success(f"[NEW] {name} → {partner_id}")
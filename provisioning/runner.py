@@ -16,7 +16,7 @@ from rich.console import Console
 from rich.progress import Progress
 from rich.table import Table
 
-from .config import OdooConfig
+from .config import get_odoo_config
 from .client import OdooClient
 from provisioning.utils import (
     log_header, log_success, log_info, log_warn, log_error, set_progress_hook,
@@ -47,7 +47,7 @@ def print_kpi_summary(report: Dict, console: Console) -> None:
     console.print(table)
 
 def _build_client_from_env() -> OdooClient:
-    config = OdooConfig.from_env()
+    config = get_odoo_config()
     log_info(f"[MES v5.0] {config.url}/{config.db}")
     return OdooClient(config=config)
 
@@ -59,8 +59,17 @@ def run(kpi_only: bool = False, base_data_dir: Optional[str] = None, klt_csv_con
         base_data_dir = os.path.join(project_root, "data")
     
     log_info(f"[RUNNER v5.0] base_data_dir={base_data_dir}")
-    client = _build_client_from_env()
-    
+    # Ein Client (Keep-Alive-Verbindungen, ThreadPool) für alle Phasen, danach freigeben
+    with _build_client_from_env() as client:
+        _run_pipeline(client, console, kpi_only, base_data_dir, klt_csv_content)
+
+def _run_pipeline(
+    client: OdooClient,
+    console: Console,
+    kpi_only: bool,
+    base_data_dir: str,
+    klt_csv_content: Optional[str],
+) -> None:
     if kpi_only:
         report = _run_kpi_only(client, base_data_dir)
         print_kpi_summary(report, console)
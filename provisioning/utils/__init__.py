@@ -1,5 +1,6 @@
 from .utils import (
     log_header, log_success, log_info, log_warn, log_error,
-    set_progress_hook, bump_progress, log_kpi_summary  # Added
+    set_progress_hook, bump_progress, log_kpi_summary,  # Added
+    write_json,
 )
 from .csv_cleaner import csv_rows, join_path, normalize_all
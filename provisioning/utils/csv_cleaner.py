@@ -4,6 +4,7 @@ No circular imports – Direct execution + products_loader support
 """
 
 import csv
+import io
 import os
 import re
 import sys
@@ -11,10 +12,10 @@ from typing import Dict, Iterator, List
 
 
 # INLINE LOGGING (no utils import)
+_HEADER_RULE = "═" * 70
+
 def log_header(msg: str):
-    print(f"\n{'═' * 70}")
-    print(f"📦 {msg}")
-    print(f"{'═' * 70}\n")
+    print(f"\n{_HEADER_RULE}\n📦 {msg}\n{_HEADER_RULE}\n")
 
 
 def log_success(msg: str):
@@ -34,14 +35,43 @@ def join_path(base_dir: str, *parts: str) -> str:
     return os.path.join(base_dir, *parts)
 
 
+# Reihenfolge der Decodier-Versuche: UTF-8 (BOM wird mitentfernt), Excel-Export, Fallback
+ENCODING_CHAIN = ("utf-8-sig", "cp1252", "latin-1")
+
+
+def _read_text(path: str) -> str:
+    """Datei in EINEM read() holen und mit der ersten passenden Kodierung decodieren."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    for encoding in ENCODING_CHAIN[:-1]:
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return raw.decode(ENCODING_CHAIN[-1])
+
+
 def csv_rows(path: str, delimiter: str = ",") -> Iterator[Dict[str, str]]:
     if not os.path.exists(path):
         log_warn(f"CSV missing: {path}")
         return
-    with open(path, newline="", encoding='utf-8') as f:
-        reader = csv.DictReader(f, delimiter=delimiter)
-        for row in reader:
-            cleaned = {k.strip() or "Unnamed": v.strip() or "" for k, v in row.items()}
+    with io.StringIO(_read_text(path), newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        # Header einmal bereinigen statt pro Zeile jeden Key zu strippen;
+        # interniert, damit row["default_code"] & Co. per Identität treffen
+        for header in reader:
+            if header:
+                break
+        else:
+            return
+        keys = [sys.intern(k.strip() or "Unnamed") for k in header]
+        width = len(keys)
+        for values in reader:
+            if not values:
+                continue
+            if len(values) < width:
+                values += [""] * (width - len(values))
+            cleaned = dict(zip(keys, [v.strip() for v in values]))
             if any(cleaned.values()):
                 yield cleaned
 
@@ -61,11 +91,17 @@ CSV_MAPPING = {
 }
 
 
+# Pro CSV-Zeile genutzt → einmal kompilieren
+_DECIMAL_COMMA = re.compile(r'([0-9]+),([0-9]{2})', re.ASCII)
+_EUR_SPACING = re.compile(r'EUR\s*')
+
+
 def normalize_price(price_raw: str) -> str:
     if not price_raw: return ""
-    price = re.sub(r'([0-9]+),([0-9]{2})', r'\1.\2', price_raw)
-    price = re.sub(r'EUR\s*', 'EUR ', price).replace('€', 'EUR')
-    return price.strip()
+    price = _DECIMAL_COMMA.sub(r'\1.\2', price_raw) if ',' in price_raw else price_raw
+    if 'EUR' in price:
+        price = _EUR_SPACING.sub('EUR ', price)
+    return price.replace('€', 'EUR').strip()
 
 
 def merge_duplicates(rows: List[Dict], merge_col: str) -> List[Dict]:
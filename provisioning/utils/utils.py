@@ -1,38 +1,92 @@
 """
 MES Utils v1.0 – Logging + Progress (for all loaders)
 """
-from typing import Callable
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Optional
 
-_progress_hook: Callable[[str], None] = print
+try:  # optional: C-beschleunigtes JSON
+    import orjson
+except ImportError:  # pragma: no cover - Fallback ohne orjson
+    orjson = None
 
-def set_progress_hook(hook: Callable[[str], None]):
-    global _progress_hook
+_progress_hook: Optional[Callable[[float], None]] = None
+_PROGRESS_INTERVAL = 0.1  # Sekunden zwischen zwei Hook-Aufrufen
+_progress_pending = 0.0
+_progress_emitted_at = 0.0
+
+# LOG_LEVEL=WARNING unterdrückt header/info/success (einmal beim Import gelesen)
+_LOG_THRESHOLD = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+if not isinstance(_LOG_THRESHOLD, int):
+    _LOG_THRESHOLD = logging.INFO
+_INFO_ON = _LOG_THRESHOLD <= logging.INFO
+_WARN_ON = _LOG_THRESHOLD <= logging.WARNING
+
+# Trennlinien einmal bauen statt pro Aufruf
+_HEADER_RULE = "═" * 80
+_KPI_RULE = "─" * 60
+
+def set_progress_hook(hook: Optional[Callable[[float], None]]):
+    """Setzt den Fortschritts-Hook; Gesammeltes geht vorher noch an den alten."""
+    global _progress_hook, _progress_pending
+    if _progress_hook is not None and _progress_pending:
+        _progress_hook(_progress_pending)
+    _progress_pending = 0.0
     _progress_hook = hook
 
-def bump_progress(msg: str):
-    _progress_hook(msg)
+def bump_progress(step: float = 1.0):
+    """
+    Erhöht den Fortschritt. Schritte werden gesammelt und höchstens alle
+    100 ms an den Hook gereicht – bei tausenden Zeilen ein Update statt
+    tausender. Ohne Hook passiert nichts.
+    """
+    global _progress_pending, _progress_emitted_at
+    if _progress_hook is None:
+        return
+    _progress_pending += step
+    now = time.monotonic()
+    if now - _progress_emitted_at >= _PROGRESS_INTERVAL:
+        _progress_hook(_progress_pending)
+        _progress_pending = 0.0
+        _progress_emitted_at = now
 
 def log_header(msg: str):
-    print(f"\n{'═' * 80}")
-    print(f"📦 {msg}")
-    print(f"{'═' * 80}\n")
+    if not _INFO_ON:
+        return
+    # Ein print statt drei → ein write() auf stdout
+    print(f"\n{_HEADER_RULE}\n📦 {msg}\n{_HEADER_RULE}\n")
 
 def log_success(msg: str):
-    print(f"✅ {msg}")
+    if _INFO_ON:
+        print(f"✅ {msg}")
 
 def log_info(msg: str):
-    print(f"ℹ️  {msg}")
+    if _INFO_ON:
+        print(f"ℹ️  {msg}")
 
 def log_warn(msg: str):
-    print(f"⚠️  {msg}")
+    if _WARN_ON:
+        print(f"⚠️  {msg}")
 
 def log_error(msg: str):
     print(f"❌ {msg}")
 
 def log_kpi_summary(kpis: dict):
     """KPI Dashboard Summary for MES"""
-    print(f"\n📊 KPI SUMMARY")
-    print(f"{'─' * 60}")
-    for k, v in kpis.items():
-        print(f"{k:20}: {v}")
-    print(f"{'─' * 60}\n")
+    if not _INFO_ON:
+        return
+    lines = ["\n📊 KPI SUMMARY", _KPI_RULE]
+    lines.extend(f"{k:20}: {v}" for k, v in kpis.items())
+    lines.append(f"{_KPI_RULE}\n")
+    print("\n".join(lines))
+
+def write_json(path, data: Any, default: Optional[Callable[[Any], Any]] = None) -> None:
+    """JSON-Export (indent 2, UTF-8) in EINEM write(); orjson falls installiert."""
+    if orjson is not None:
+        payload = orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2, default=default).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
@@ -0,0 +1,38 @@
+# scripts/dump_env.py
+import os
+
+import typer
+from dotenv import dotenv_values
+
+from provisioning.config import ENV_PATH, ENV_CACHE_PATH
+from provisioning.utils import log_header, log_success, log_error
+
+app = typer.Typer(add_completion=False)
+
+
+@app.command()
+def dump(
+    env_file: str = typer.Option(ENV_PATH, help="Quelle (.env)"),
+    target: str = typer.Option(ENV_CACHE_PATH, help="Ziel (Python-Modul mit ENV-Dict)"),
+):
+    """
+    Schreibt .env als Python-Dict-Modul (provisioning/config_cache.py).
+
+    config.py importiert es statt .env per Regex zu parsen; das .pyc wird
+    gecacht. Enthält Secrets → nicht committen (.gitignore).
+    """
+    log_header("ENV-Cache erzeugen")
+    if not os.path.exists(env_file):
+        log_error(f"{env_file} nicht gefunden")
+        raise typer.Exit(code=1)
+    values = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+    lines = ["# Automatisch erzeugt von scripts/dump_env.py – nicht bearbeiten, nicht committen.", "ENV = {"]
+    lines += [f"    {key!r}: {value!r}," for key, value in sorted(values.items())]
+    lines.append("}")
+    with open(target, "w", encoding="utf-8") as fh:
+        fh.write("\n".join(lines) + "\n")
+    log_success(f"{len(values)} Variablen → {target}")
+
+
+if __name__ == "__main__":
+    app()